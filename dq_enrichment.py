@@ -14,13 +14,29 @@ Environment Variables:
     ATLAN_BASE_URL: Your Atlan instance URL (required, e.g., https://your-tenant.atlan.com)
 """
 
-import csv
+import atexit
+import copy
+import functools
+import hashlib
+import json
 import os
+import queue
+import random
 import sys
+import time
 import logging
 import argparse
-from typing import List, Dict, Optional, Set
-from dataclasses import dataclass
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Iterator, List, Dict, Optional, Set, Tuple
+
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from dataclasses import dataclass, field
 from datetime import datetime
 
 try:
@@ -28,22 +44,40 @@ try:
     from pyatlan.model.assets import Column, Asset
     from pyatlan.model.enums import AtlanConnectorType
     from pyatlan.cache.role_cache import RoleCache
-    from pyatlan.model.search import DSL, Term, Bool
+    from pyatlan.model.search import DSL, Term, Terms, Bool
     from pyatlan.model.response import AssetMutationResponse
     from pyatlan.model.custom_metadata import CustomMetadataDict
+    from pyatlan.errors import AtlanError
 except ImportError:
     print("ERROR: pyatlan package not found. Please install it with: pip install pyatlan")
     sys.exit(1)
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler(f'dq_enrichment_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log')
-    ]
-)
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+# Configure logging. Worker threads log concurrently, so handlers sit
+# behind a QueueHandler: workers enqueue records in-memory while a
+# background QueueListener owns the (blocking) stream and file writes.
+_log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+_log_handlers = [
+    logging.StreamHandler(),
+    logging.FileHandler(f'dq_enrichment_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log')
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+
+_log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+_log_listener = QueueListener(_log_queue, *_log_handlers, respect_handler_level=True)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+# The queue handler passes records through unformatted; the listener's
+# handlers apply the real format
+_queue_handler = QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
 logger = logging.getLogger(__name__)
 
 # Constants
@@ -51,9 +85,43 @@ SNOWFLAKE_ACCOUNT = "qia75894"
 CONNECTION_NAME = "snowflake_connection_60"
 DQ_CUSTOM_METADATA_NAME = "DQ"
 DQ_CUSTOM_METADATA_GUID = "faf3353d-86c2-4214-b4fc-f3fccf1991dd"
-
-
-@dataclass
+CACHE_DIR = os.path.expanduser("~/.atlan_dq_cache")
+CACHE_TTL_SECONDS = 24 * 60 * 60
+MEMORY_CACHE_MAXSIZE = 100_000
+_QN_PREFIX = f"default/snowflake/{SNOWFLAKE_ACCOUNT}"
+_REQUIRED_COLUMNS = frozenset({'DATABASE', 'SCHEMA', 'TABLE', 'COLUMN', 'DQ_NULL_COUNT', 'DQ_STRINGLENGTH'})
+
+
+def retry_on(exceptions, tries: int = 3, delay: float = 0.3, backoff: float = 2, jitter: float = 0.1):
+    """Retry decorator with exponential backoff and jitter.
+
+    Retries transient application-level failures (the HTTP layer handles
+    its own retries via urllib3's Retry policy). Each retry is logged so
+    operators can see transient pressure.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            attempt = 1
+            wait_s = delay
+            while True:
+                try:
+                    return func(*args, **kwargs)
+                except exceptions as e:
+                    if attempt >= tries:
+                        raise
+                    sleep_for = wait_s + random.uniform(0, jitter)
+                    logger.warning(
+                        f"{func.__name__} failed ({e}); retry {attempt}/{tries - 1} in {sleep_for:.1f}s"
+                    )
+                    time.sleep(sleep_for)
+                    wait_s *= backoff
+                    attempt += 1
+        return wrapper
+    return decorator
+
+
+@dataclass(frozen=True, slots=True)
 class DQRecord:
     """Represents a DQ result record from CSV"""
     database: str
@@ -62,11 +130,18 @@ class DQRecord:
     column: str
     dq_null_count: Optional[str]
     dq_stringlength: Optional[str]
-
-    @property
-    def qualified_name(self) -> str:
-        """Generate Atlan qualified name for the column asset"""
-        return f"default/snowflake/{SNOWFLAKE_ACCOUNT}/{self.database}/{self.schema}/{self.table}/{self.column}"
+    # Atlan qualified name for the column asset; callers that already built
+    # it (e.g. vectorized over a whole chunk) pass it in, otherwise it is
+    # built once at construction
+    qualified_name: str = field(default='', repr=False)
+
+    def __post_init__(self):
+        if not self.qualified_name:
+            object.__setattr__(
+                self,
+                'qualified_name',
+                "/".join((_QN_PREFIX, self.database, self.schema, self.table, self.column))
+            )
 
     def __str__(self):
         return f"{self.database}.{self.schema}.{self.table}.{self.column}"
@@ -75,10 +150,13 @@ class DQRecord:
 class DQEnrichmentProcessor:
     """Processes DQ results and enriches Atlan assets"""
 
-    def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None,
+                 max_workers: int = 8, verify_assets: bool = False):
         """Initialize the processor with Atlan client"""
         self.api_key = api_key or os.environ.get("ATLAN_API_KEY")
         self.base_url = base_url or os.environ.get("ATLAN_BASE_URL")
+        self.max_workers = max_workers
+        self.verify_assets = verify_assets
 
         if not self.api_key:
             raise ValueError("ATLAN_API_KEY environment variable or api_key parameter is required")
@@ -87,6 +165,72 @@ class DQEnrichmentProcessor:
 
         logger.info(f"Initializing Atlan client for {self.base_url}")
         self.client = AtlanClient(api_key=self.api_key, base_url=self.base_url)
+        self._tune_connection_pool()
+
+        # Batches are dispatched concurrently; stats are shared across workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._stats_lock = threading.Lock()
+
+        # Disk-backed cache so re-runs skip lookups (and no-op saves) for
+        # assets seen before; disabled when diskcache isn't installed
+        if diskcache is not None:
+            self.cache = diskcache.Cache(CACHE_DIR)
+            logger.info(f"Using asset cache at {CACHE_DIR}")
+        else:
+            self.cache = None
+            logger.info("diskcache not installed; asset caching disabled")
+
+        # In-process write-through LRU in front of the disk cache, so repeat
+        # lookups within a run skip deserializing pickled entries
+        self._memory_cache: "OrderedDict[str, object]" = OrderedDict()
+        self._memory_cache_lock = threading.Lock()
+
+        # Resolve the DQ custom-metadata definition once; CustomMetadataDict
+        # construction resolves attribute definitions through pyatlan's
+        # caches, and those definitions are static for the life of a run.
+        # Resolution needs a reachable tenant and the current constructor
+        # signature, so failure just disables the template and the model
+        # path attaches a plain dict per record instead.
+        try:
+            self._cm_template = CustomMetadataDict(self.client, DQ_CUSTOM_METADATA_NAME)
+        except Exception as e:
+            logger.debug(f"Could not prewarm custom-metadata template: {e}")
+            self._cm_template = None
+        try:
+            self._cm_attr_ids = self.client.custom_metadata_cache.get_attributes_for_search_results(
+                DQ_CUSTOM_METADATA_NAME
+            )
+        except Exception as e:
+            # Resolution goes over the network through whichever transport
+            # the installed pyatlan uses, so any failure here just means
+            # no prewarm
+            logger.debug(f"Could not prewarm custom-metadata attribute ids: {e}")
+            self._cm_attr_ids = None
+
+        # With the DQ set and attribute ids resolved, updates can be posted
+        # as prebuilt raw entities, skipping pydantic model validation per
+        # record; falls back to the model-based path when resolution fails.
+        # The raw POST (and its retry/fallback exception handling) is
+        # written against requests.Session, so the fast path is only
+        # enabled when pyatlan's underlying session actually is one —
+        # httpx-based clients use the model-based save path instead,
+        # mirroring _tune_connection_pool.
+        self._raw_ids = None
+        if isinstance(getattr(self.client, '_session', None), requests.Session):
+            try:
+                cm_cache = self.client.custom_metadata_cache
+                self._raw_ids = (
+                    cm_cache.get_id_for_name(DQ_CUSTOM_METADATA_NAME),
+                    cm_cache.get_attr_id_for_name(DQ_CUSTOM_METADATA_NAME, 'DQ_NULL_COUNT'),
+                    cm_cache.get_attr_id_for_name(DQ_CUSTOM_METADATA_NAME, 'DQ_STRINGLENGTH'),
+                )
+                logger.debug("Raw entity fast path enabled for custom-metadata saves")
+            except Exception as e:
+                logger.debug(f"Raw entity fast path unavailable: {e}")
+        else:
+            logger.debug(
+                "Atlan client session is not a requests.Session; raw entity fast path disabled"
+            )
 
         # Statistics
         self.stats = {
@@ -94,169 +238,462 @@ class DQEnrichmentProcessor:
             'assets_found': 0,
             'assets_updated': 0,
             'assets_not_found': 0,
+            'rows_skipped_empty': 0,
+            'skipped_unchanged': 0,
             'errors': 0
         }
 
-    def read_csv(self, csv_file: str) -> List[DQRecord]:
-        """Read DQ results from CSV file"""
+    def _tune_connection_pool(self) -> None:
+        """Widen the client's connection pool to match the worker count.
+
+        The default urllib3 pool holds 10 connections; with more workers than
+        that, extra calls pay a fresh TCP/TLS handshake on every request.
+        Mount an adapter sized for the pool and add retries for transient
+        HTTP errors. Skipped silently if pyatlan's underlying session is not
+        a requests.Session.
+        """
+        session = getattr(self.client, '_session', None)
+        if not isinstance(session, requests.Session):
+            logger.debug("Atlan client session is not a requests.Session; leaving pool untouched")
+            return
+
+        adapter = HTTPAdapter(
+            pool_connections=self.max_workers,
+            pool_maxsize=self.max_workers * 2,
+            max_retries=Retry(
+                total=5,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=frozenset(["GET", "POST", "PUT"]),
+                respect_retry_after_header=True
+            )
+        )
+        session.mount("https://", adapter)
+        # Keep-alive reuses TCP+TLS connections across calls; gzip responses
+        # shrink the large search payloads on the wire
+        session.headers.update({
+            "Connection": "keep-alive",
+            "Accept-Encoding": "gzip, deflate"
+        })
+
+        if logger.isEnabledFor(logging.DEBUG):
+            def _log_encoding(response, *args, **kwargs):
+                logger.debug(f"Response Content-Encoding: {response.headers.get('Content-Encoding')}")
+
+            session.hooks.setdefault('response', []).append(_log_encoding)
+
+        logger.debug(f"Connection pool sized for {self.max_workers} workers")
+
+    def _cache_get(self, key: str):
+        """Look up a key in the memory LRU first, falling back to disk.
+
+        Disk hits are promoted into the memory cache so the pickled entry is
+        only deserialized once per run.
+        """
+        with self._memory_cache_lock:
+            if key in self._memory_cache:
+                self._memory_cache.move_to_end(key)
+                return self._memory_cache[key]
+
+        if self.cache is None:
+            return None
+
+        value = self.cache.get(key)
+        if value is not None:
+            self._memory_put(key, value)
+        return value
+
+    def _cache_set(self, key: str, value) -> None:
+        """Write-through: update both the memory LRU and the disk cache"""
+        self._memory_put(key, value)
+        if self.cache is not None:
+            self.cache.set(key, value, expire=CACHE_TTL_SECONDS)
+
+    def _memory_put(self, key: str, value) -> None:
+        with self._memory_cache_lock:
+            self._memory_cache[key] = value
+            self._memory_cache.move_to_end(key)
+            while len(self._memory_cache) > MEMORY_CACHE_MAXSIZE:
+                self._memory_cache.popitem(last=False)
+
+    def _bump_stat(self, key: str, amount: int = 1) -> None:
+        """Thread-safe increment of a statistics counter"""
+        with self._stats_lock:
+            self.stats[key] += amount
+
+    def iter_batches(self, csv_file: str, batch_size: int) -> Iterator[List[DQRecord]]:
+        """Stream DQ results from CSV file, one batch of records at a time.
+
+        Parsing goes through pandas' C engine with chunksize=batch_size, so
+        memory stays bounded by the batch size while the per-row Python loop
+        is replaced by vectorized column transforms.
+        """
         logger.info(f"Reading CSV file: {csv_file}")
-        records = []
 
         try:
-            with open(csv_file, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-
-                # Validate required columns
-                required_columns = {'DATABASE', 'SCHEMA', 'TABLE', 'COLUMN', 'DQ_NULL_COUNT', 'DQ_STRINGLENGTH'}
-                if not required_columns.issubset(set(reader.fieldnames)):
-                    raise ValueError(f"CSV must contain columns: {required_columns}")
-
-                for row_num, row in enumerate(reader, start=2):  # Start at 2 (1 is header)
-                    try:
-                        record = DQRecord(
-                            database=row['DATABASE'].strip().upper(),
-                            schema=row['SCHEMA'].strip().upper(),
-                            table=row['TABLE'].strip().upper(),
-                            column=row['COLUMN'].strip().upper(),
-                            dq_null_count=row.get('DQ_NULL_COUNT', '').strip() or None,
-                            dq_stringlength=row.get('DQ_STRINGLENGTH', '').strip() or None
-                        )
-                        records.append(record)
-                    except Exception as e:
-                        logger.warning(f"Skipping row {row_num} due to error: {e}")
-                        continue
-
-            logger.info(f"Successfully read {len(records)} records from CSV")
-            self.stats['total_records'] = len(records)
-            return records
+            reader = pd.read_csv(
+                csv_file,
+                usecols=list(_REQUIRED_COLUMNS),
+                dtype=str,
+                chunksize=batch_size,
+                na_filter=False
+            )
+
+            for chunk in reader:
+                # Vectorized normalization instead of per-row strip/upper
+                for col in ('DATABASE', 'SCHEMA', 'TABLE', 'COLUMN'):
+                    chunk[col] = chunk[col].str.strip().str.upper()
+                for col in ('DQ_NULL_COUNT', 'DQ_STRINGLENGTH'):
+                    chunk[col] = chunk[col].str.strip()
+
+                # Rows with no DQ values would only waste a search and a
+                # batch slot downstream; drop them here
+                has_values = (chunk['DQ_NULL_COUNT'] != '') | (chunk['DQ_STRINGLENGTH'] != '')
+                skipped = int((~has_values).sum())
+                if skipped:
+                    self._bump_stat('rows_skipped_empty', skipped)
+                    chunk = chunk[has_values]
+
+                # Build the whole chunk's qualified names in one vectorized
+                # concatenation instead of a per-row join
+                chunk = chunk.assign(
+                    QUALIFIED_NAME=_QN_PREFIX + '/' + chunk['DATABASE'] + '/'
+                    + chunk['SCHEMA'] + '/' + chunk['TABLE'] + '/' + chunk['COLUMN']
+                )
+
+                batch = [
+                    DQRecord(
+                        database=row.DATABASE,
+                        schema=row.SCHEMA,
+                        table=row.TABLE,
+                        column=row.COLUMN,
+                        dq_null_count=row.DQ_NULL_COUNT or None,
+                        dq_stringlength=row.DQ_STRINGLENGTH or None,
+                        qualified_name=row.QUALIFIED_NAME
+                    )
+                    for row in chunk.itertuples(index=False)
+                ]
+                if batch:
+                    yield batch
 
         except FileNotFoundError:
             logger.error(f"CSV file not found: {csv_file}")
             raise
+        except ValueError as e:
+            # pandas raises ValueError when usecols names are missing
+            logger.error(f"CSV must contain columns: {set(_REQUIRED_COLUMNS)} ({e})")
+            raise
         except Exception as e:
             logger.error(f"Error reading CSV file: {e}")
             raise
 
-    def fetch_assets_bulk(self, qualified_names: List[str]) -> Dict[str, Column]:
-        """
-        Fetch multiple assets efficiently using metadata lakehouse.
+    @retry_on(exceptions=(AtlanError, requests.Timeout))
+    def _execute_search(self, qualified_names: List[str]):
+        """Build and execute the bulk qualified-name search, returning the
+        lazily-paginating result iterator"""
+        # A single Terms clause sends one array instead of N should-clauses,
+        # letting Elasticsearch use its optimized terms lookup
+        query = Bool(
+            filter=[
+                Term(field="__typeName", value="Column"),
+                Term(field="__state", value="ACTIVE"),
+                Terms(field="qualifiedName", values=qualified_names)
+            ]
+        )
+
+        dsl = DSL(query=query)
 
-        This uses Atlan's search API with bulk qualified name lookups,
-        which is optimized through the metadata lakehouse architecture.
+        # Page size fits the whole batch; pyatlan's result iterator pages
+        # lazily (search_after under the hood) so deep result sets don't
+        # sit fully in memory
+        return (
+            self.client.asset.search(dsl=dsl)
+            .page_size(min(len(qualified_names), 500))
+        )
+
+    def iter_assets_bulk(self, qualified_names: List[str]) -> Iterator[Tuple[str, Column]]:
         """
-        logger.info(f"Fetching {len(qualified_names)} assets from Atlan (bulk operation)...")
+        Stream assets for the given qualified names, yielding as they arrive.
 
-        assets_map = {}
+        Cache hits are yielded first without touching the network; misses are
+        resolved through one bulk search whose pages stream lazily, so the
+        caller can start building updates while later pages are in flight.
+        """
+        # Serve what we can from the local caches and only query Atlan for misses
+        misses = []
+        cache_hits = 0
+        for qn in qualified_names:
+            cached = self._cache_get(qn)
+            if cached is not None:
+                guid, cached_qn = cached
+                column = Column()
+                column.guid = guid
+                column.qualified_name = cached_qn
+                cache_hits += 1
+                yield qn, column
+            else:
+                misses.append(qn)
 
-        try:
-            # Build search query for bulk retrieval
-            # Use Terms query for efficient OR matching on qualified names
-            query = Bool(
-                filter=[
-                    Term(field="__typeName", value="Column"),
-                    Term(field="__state", value="ACTIVE")
-                ],
-                should=[
-                    Term(field="qualifiedName", value=qn) for qn in qualified_names
-                ],
-                minimum_should_match=1
-            )
+        if cache_hits:
+            logger.info(f"Resolved {cache_hits} assets from local cache")
 
-            dsl = DSL(query=query)
+        if not misses:
+            return
 
-            # Execute search with appropriate page size
-            search_request = (
-                self.client.asset.search(dsl=dsl)
-                .page_size(min(len(qualified_names), 100))
-            )
+        logger.info(f"Fetching {len(misses)} assets from Atlan (bulk operation)...")
 
-            # Iterate through results
-            for asset in search_request:
+        try:
+            fetched = 0
+            for asset in self._execute_search(misses):
                 if isinstance(asset, Column) and asset.qualified_name:
-                    assets_map[asset.qualified_name] = asset
-                    logger.debug(f"Found asset: {asset.qualified_name}")
+                    fetched += 1
+                    self._cache_set(asset.qualified_name, (asset.guid, asset.qualified_name))
+                    logger.debug("Found asset: %s", asset.qualified_name)
+                    yield asset.qualified_name, asset
 
-            logger.info(f"Successfully fetched {len(assets_map)} assets from Atlan")
+            logger.info(f"Successfully fetched {fetched} assets from Atlan")
 
         except Exception as e:
             logger.error(f"Error during bulk asset fetch: {e}")
             raise
 
-        return assets_map
-
-    def update_custom_metadata(self, asset: Column, record: DQRecord) -> bool:
+    def _build_update(self, record: DQRecord) -> Optional[Tuple[Column, bytes]]:
         """
-        Update custom metadata on a single asset
+        Build the Column update carrying DQ custom metadata, without saving it
+
+        The update is addressed by qualified name alone, so no prior fetch of
+        the asset is required.
 
         Args:
-            asset: The Column asset to update
             record: The DQ record containing the values to set
 
         Returns:
-            bool: True if update successful, False otherwise
+            Optional[Tuple[Column, bytes]]: The update payload and a digest of
+            its DQ values, or None if the values match what was last written
+            (per the local cache)
         """
-        try:
-            # Build custom metadata dictionary
-            custom_metadata = {}
+        # Build custom metadata dictionary
+        custom_metadata = {}
+
+        if record.dq_null_count is not None:
+            custom_metadata['DQ_NULL_COUNT'] = record.dq_null_count
+
+        if record.dq_stringlength is not None:
+            custom_metadata['DQ_STRINGLENGTH'] = record.dq_stringlength
+
+        # Skip the save entirely when the values haven't changed since the
+        # last successful write for this asset
+        new_hash = hashlib.blake2b(json.dumps(custom_metadata, sort_keys=True).encode()).digest()
+        if self._cache_get(f"cmhash:{record.qualified_name}") == new_hash:
+            logger.debug("DQ values unchanged for %s; skipping save", record)
+            self._bump_stat('skipped_unchanged')
+            return None
+
+        # Fast path: emit the raw entity dict directly when the metadata ids
+        # are known, skipping per-record model validation
+        if self._raw_ids is not None:
+            return self._build_raw_entity(record, custom_metadata), new_hash
+
+        # Create updated asset with custom metadata, addressed by qualified
+        # name so the save needs no prior read
+        updated_column = Column()
+        updated_column.qualified_name = record.qualified_name
+        updated_column.name = record.column
+
+        # Reuse the prewarmed template's resolved attribute definitions, but
+        # give each record its own inner mapping: a plain shallow copy would
+        # alias the template's dict across the executor workers
+        if self._cm_template is not None:
+            cm_dict = copy.copy(self._cm_template)
+            cm_dict.data = {}
+        else:
+            # Template resolution failed at init (e.g. tenant unreachable);
+            # retry per record so the run degrades to logged errors for the
+            # affected rows instead of crashing
+            try:
+                cm_dict = CustomMetadataDict(self.client, DQ_CUSTOM_METADATA_NAME)
+            except Exception as e:
+                logger.error(
+                    "Cannot resolve custom metadata %s for %s: %s",
+                    DQ_CUSTOM_METADATA_NAME, record, e
+                )
+                self._bump_stat('errors')
+                return None
+
+        for key, value in custom_metadata.items():
+            cm_dict[key] = value
+        updated_column.set_custom_metadata(self.client, cm_dict)
+
+        return updated_column, new_hash
+
+    def _build_raw_entity(self, record: DQRecord, custom_metadata: Dict[str, str]) -> Dict:
+        """Build the bulk-endpoint entity payload for one record directly,
+        using the prewarmed set and attribute ids"""
+        set_id, null_id, len_id = self._raw_ids
+
+        business: Dict[str, str] = {}
+        if 'DQ_NULL_COUNT' in custom_metadata:
+            business[null_id] = custom_metadata['DQ_NULL_COUNT']
+        if 'DQ_STRINGLENGTH' in custom_metadata:
+            business[len_id] = custom_metadata['DQ_STRINGLENGTH']
+
+        return {
+            "typeName": "Column",
+            "attributes": {
+                "qualifiedName": record.qualified_name,
+                "name": record.column
+            },
+            "businessAttributes": {set_id: business}
+        }
 
-            if record.dq_null_count is not None:
-                custom_metadata['DQ_NULL_COUNT'] = record.dq_null_count
+    @retry_on(exceptions=(AtlanError, requests.Timeout))
+    def _post_entities(self, entities: List[Dict]) -> Dict:
+        """POST raw entities to the bulk endpoint through the client session"""
+        session = getattr(self.client, '_session', None)
+        if not isinstance(session, requests.Session):
+            # Guarded at init; reaching this means the fast path was
+            # enabled against a client that cannot serve it
+            raise TypeError("raw entity POST requires pyatlan's requests.Session")
+        response = session.post(
+            f"{self.base_url.rstrip('/')}/api/meta/entity/bulk",
+            json={"entities": entities}
+        )
+        response.raise_for_status()
+        return response.json()
 
-            if record.dq_stringlength is not None:
-                custom_metadata['DQ_STRINGLENGTH'] = record.dq_stringlength
+    def _save_raw_updates(self, entities: List[Dict]) -> Set[str]:
+        """Save raw entity payloads in one bulk POST, falling back to
+        per-entity posts if the bulk call fails"""
+        updated_names: Set[str] = set()
 
-            if not custom_metadata:
-                logger.warning(f"No DQ values to update for {record}")
-                return False
+        def _collect(data: Dict) -> None:
+            mutated = data.get("mutatedEntities", {})
+            for entity in (mutated.get("UPDATE") or []) + (mutated.get("PARTIAL_UPDATE") or []):
+                qn = entity.get("attributes", {}).get("qualifiedName")
+                if qn:
+                    updated_names.add(qn)
 
-            # Create updated asset with custom metadata
-            updated_column = Column()
-            updated_column.guid = asset.guid
-            updated_column.qualified_name = asset.qualified_name
+        try:
+            _collect(self._post_entities(entities))
+            return updated_names
+        except (AtlanError, requests.RequestException) as e:
+            logger.warning(f"Bulk raw save of {len(entities)} entities failed ({e}); retrying individually")
+
+        for entity in entities:
+            try:
+                _collect(self._post_entities([entity]))
+            except (AtlanError, requests.RequestException) as e:
+                logger.error(
+                    "Error updating custom metadata for %s: %s",
+                    entity["attributes"]["qualifiedName"], e
+                )
+
+        return updated_names
+
+    @retry_on(exceptions=(AtlanError, requests.Timeout))
+    def _save_assets(self, assets) -> AssetMutationResponse:
+        """Save one asset or a list of assets, retrying transient failures.
+
+        Uses save_merging_cm so custom metadata merges into whatever is
+        already on the asset rather than replacing other sets.
+        """
+        return self.client.asset.save_merging_cm(assets)
 
-            # Set custom metadata using the CustomMetadataDict
-            cm_dict = CustomMetadataDict()
-            cm_dict[DQ_CUSTOM_METADATA_NAME] = custom_metadata
-            updated_column.custom_metadata_sets = cm_dict
+    def _save_updates(self, updates: List) -> Set[str]:
+        """
+        Save a list of updates in a single bulk request
 
-            # Update the asset
-            response: AssetMutationResponse = self.client.asset.save(updated_column)
+        Updates are raw entity dicts when the fast path is enabled, or
+        Column models otherwise. Falls back to saving assets one at a time
+        if the bulk call fails, so a single bad asset doesn't sink the batch.
 
-            if response and response.assets_updated(asset_type=Column):
-                logger.info(f"✓ Updated custom metadata for {record}")
-                return True
-            else:
-                logger.warning(f"Update response empty for {record}")
-                return False
+        Returns:
+            Set[str]: Qualified names that were actually updated
+        """
+        if self._raw_ids is not None:
+            return self._save_raw_updates(updates)
 
-        except Exception as e:
-            logger.error(f"Error updating custom metadata for {record}: {e}")
-            return False
+        updated_names: Set[str] = set()
+
+        try:
+            response: AssetMutationResponse = self._save_assets(updates)
+            if response:
+                for updated in response.assets_updated(asset_type=Column):
+                    if updated.qualified_name:
+                        updated_names.add(updated.qualified_name)
+            return updated_names
+
+        except AtlanError as e:
+            logger.warning(f"Bulk save of {len(updates)} assets failed ({e}); retrying individually")
+
+        # Fallback: retry each asset on its own
+        for update in updates:
+            try:
+                response = self._save_assets(update)
+                if response and response.assets_updated(asset_type=Column):
+                    updated_names.add(update.qualified_name)
+            except AtlanError as e:
+                logger.error("Error updating custom metadata for %s: %s", update.qualified_name, e)
+
+        return updated_names
 
     def process_batch(self, records: List[DQRecord]) -> None:
         """Process a batch of DQ records"""
         logger.info(f"Processing batch of {len(records)} records...")
 
-        # Extract qualified names for bulk fetch
-        qualified_names = [record.qualified_name for record in records]
-
-        # Fetch all assets in one bulk operation (metadata lakehouse optimization)
-        assets_map = self.fetch_assets_bulk(qualified_names)
-
-        # Update each asset with its DQ metadata
+        # Collapse duplicate rows for the same column, keeping the last value,
+        # so duplicates cost neither search payload nor redundant saves
+        by_qn: Dict[str, DQRecord] = {}
         for record in records:
-            asset = assets_map.get(record.qualified_name)
-
-            if asset:
-                self.stats['assets_found'] += 1
-                success = self.update_custom_metadata(asset, record)
-                if success:
-                    self.stats['assets_updated'] += 1
-                else:
-                    self.stats['errors'] += 1
+            by_qn[record.qualified_name] = record
+
+        if len(by_qn) < len(records):
+            logger.info(f"Coalesced {len(records) - len(by_qn)} duplicate records in batch")
+        records = list(by_qn.values())
+
+        # Updates are addressed by qualified name, so no fetch is needed
+        # before saving. When verification is requested, pre-filter the batch
+        # down to assets that actually exist via the streaming bulk search.
+        if self.verify_assets:
+            found: Dict[str, DQRecord] = {}
+            for qn, _asset in self.iter_assets_bulk(list(by_qn.keys())):
+                if qn in by_qn:
+                    found[qn] = by_qn[qn]
+                    self._bump_stat('assets_found')
+
+            for qn, record in by_qn.items():
+                if qn not in found:
+                    self._bump_stat('assets_not_found')
+                    logger.warning("✗ Asset not found in Atlan: %s", record)
+            by_qn = found
+
+        updates: List = []  # raw entity dicts or Column models, per save path
+        pending: List[DQRecord] = []
+        hashes: Dict[str, bytes] = {}
+        for qn, record in by_qn.items():
+            built = self._build_update(record)
+            if built:
+                update, value_hash = built
+                updates.append(update)
+                pending.append(record)
+                hashes[qn] = value_hash
+
+        if not updates:
+            return
+
+        # Save the whole batch in one request instead of one call per asset
+        updated_names = self._save_updates(updates)
+
+        for record in pending:
+            if record.qualified_name in updated_names:
+                self._bump_stat('assets_updated')
+                if not self.verify_assets:
+                    self._bump_stat('assets_found')
+                self._cache_set(f"cmhash:{record.qualified_name}", hashes[record.qualified_name])
+                logger.debug("✓ Updated custom metadata for %s", record)
             else:
-                self.stats['assets_not_found'] += 1
-                logger.warning(f"✗ Asset not found in Atlan: {record}")
+                self._bump_stat('errors')
+                logger.warning("Update response empty for %s (asset may not exist)", record)
 
     def process_csv(self, csv_file: str, batch_size: int = 50) -> None:
         """
@@ -272,22 +709,30 @@ class DQEnrichmentProcessor:
         logger.info("=" * 80)
 
         try:
-            # Read all records from CSV
-            records = self.read_csv(csv_file)
+            # Stream batches from CSV and dispatch them to the worker pool,
+            # keeping at most max_workers batches in flight at a time
+            batch_num = 0
+            in_flight = deque()
 
-            if not records:
-                logger.warning("No records to process")
-                return
+            for batch in self.iter_batches(csv_file, batch_size):
+                batch_num += 1
+                self._bump_stat('total_records', len(batch))
+                logger.info(f"\n--- Batch {batch_num} ({len(batch)} records) ---")
+
+                if len(in_flight) >= self.max_workers:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        in_flight.remove(future)
+                        future.result()
 
-            # Process in batches
-            total_batches = (len(records) + batch_size - 1) // batch_size
-            logger.info(f"Processing {len(records)} records in {total_batches} batches (batch_size={batch_size})")
+                in_flight.append(self._executor.submit(self.process_batch, batch))
 
-            for i in range(0, len(records), batch_size):
-                batch = records[i:i + batch_size]
-                batch_num = (i // batch_size) + 1
-                logger.info(f"\n--- Batch {batch_num}/{total_batches} ---")
-                self.process_batch(batch)
+            for future in in_flight:
+                future.result()
+
+            if self.stats['total_records'] == 0:
+                logger.warning("No records to process")
+                return
 
             # Print summary
             duration = datetime.now() - start_time
@@ -299,6 +744,8 @@ class DQEnrichmentProcessor:
             logger.info(f"Assets found: {self.stats['assets_found']}")
             logger.info(f"Assets updated successfully: {self.stats['assets_updated']}")
             logger.info(f"Assets not found: {self.stats['assets_not_found']}")
+            logger.info(f"Rows skipped (no DQ values): {self.stats['rows_skipped_empty']}")
+            logger.info(f"Skipped (values unchanged): {self.stats['skipped_unchanged']}")
             logger.info(f"Errors: {self.stats['errors']}")
 
             success_rate = (self.stats['assets_updated'] / self.stats['total_records'] * 100) if self.stats['total_records'] > 0 else 0
@@ -308,6 +755,8 @@ class DQEnrichmentProcessor:
         except Exception as e:
             logger.error(f"Fatal error during processing: {e}", exc_info=True)
             raise
+        finally:
+            self._executor.shutdown(wait=True)
 
 
 def main():
@@ -340,6 +789,19 @@ Example:
         help='Number of records to process in each batch (default: 50)'
     )
 
+    parser.add_argument(
+        '--verify-assets',
+        action='store_true',
+        help='Verify assets exist in Atlan (extra search) before saving updates'
+    )
+
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=8,
+        help='Number of batches to process concurrently (default: 8)'
+    )
+
     parser.add_argument(
         '--api-key',
         help='Atlan API key (alternatively set ATLAN_API_KEY env variable)'
@@ -355,7 +817,9 @@ Example:
     try:
         processor = DQEnrichmentProcessor(
             api_key=args.api_key,
-            base_url=args.base_url
+            base_url=args.base_url,
+            max_workers=args.workers,
+            verify_assets=args.verify_assets
         )
         processor.process_csv(args.csv_file, args.batch_size)
 
@@ -24,13 +24,81 @@ import json
 import os
 import sys
 from datetime import datetime
+from heapq import nlargest
+from operator import itemgetter
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+if __package__:
+    # Run as `python -m src.app`: sibling modules aren't importable bare,
+    # so put this directory on the path. Direct `python src/app.py` runs
+    # get it for free from the interpreter and skip the syscall entirely.
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# slack_client / slack_metadata_analyzer / transcript_parser are imported
+# lazily inside each command so `--help` and `test-connection` don't pay
+# for the analyzer's regex compilation or unused dependencies.
+
+
+def write_json_report(data: dict, path: str):
+    """Write a JSON report, using orjson's C serializer when available."""
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2)
+
+
+def read_json_file(path: str) -> dict:
+    """Load a JSON file, using orjson's C parser when available."""
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path, "r") as f:
+        return json.load(f)
 
-# Add src to path for imports
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from slack_client import SlackClient, SlackClientError, test_connection
-from slack_metadata_analyzer import SlackMetadataAnalyzer, format_markdown_report
-from transcript_parser import parse_transcript_file
+def read_messages_file(path: str) -> dict:
+    """Load an exported messages document.
+
+    With ijson installed, the messages array is streamed one element at a
+    time in a single pass, so large exports never hold both the raw text
+    and the decoded document in memory. Falls back to a whole-file load.
+    """
+    if ijson is None:
+        return read_json_file(path)
+
+    data = {"messages": []}
+    builder = None
+    try:
+        with open(path, "rb") as f:
+            for prefix, event, value in ijson.parse(f):
+                if prefix.startswith("messages.item"):
+                    if prefix == "messages.item" and event == "start_map":
+                        builder = ijson.ObjectBuilder()
+                    builder.event(event, value)
+                    if prefix == "messages.item" and event == "end_map":
+                        data["messages"].append(builder.value)
+                        builder = None
+                elif prefix and "." not in prefix and event in (
+                        "string", "number", "boolean", "null"):
+                    # Root-level metadata like channel_name / date_range
+                    data[prefix] = value
+    except ijson.JSONError as e:
+        # ijson's errors don't subclass ValueError the way the stdlib's
+        # JSONDecodeError does; re-raise so callers see one exception type
+        raise ValueError(str(e)) from e
+    return data
 
 
 def print_banner():
@@ -44,63 +112,73 @@ def print_banner():
     print(banner)
 
 
-def print_summary(results: dict):
-    """Print a summary of the analysis to console."""
-    print("\n" + "=" * 60)
-    print("ANALYSIS SUMMARY")
-    print("=" * 60)
+def format_summary(results: dict) -> str:
+    """Build the analysis summary as a single string."""
+    lines = []
+    lines.append("\n" + "=" * 60)
+    lines.append("ANALYSIS SUMMARY")
+    lines.append("=" * 60)
 
     summary = results.get("summary", {})
-    print(f"\n📊 Threads analyzed: {summary.get('total_threads_analyzed', 0)}")
-    print(f"📦 Unique assets identified: {summary.get('unique_assets_identified', 0)}")
-    print(f"❓ Assets with questions: {summary.get('assets_with_questions', 0)}")
+    lines.append(f"\n📊 Threads analyzed: {summary.get('total_threads_analyzed', 0)}")
+    lines.append(f"📦 Unique assets identified: {summary.get('unique_assets_identified', 0)}")
+    lines.append(f"❓ Assets with questions: {summary.get('assets_with_questions', 0)}")
 
     # Top priority assets
     priority_assets = results.get("priority_assets", [])[:5]
     if priority_assets:
-        print("\n🎯 TOP PRIORITY ASSETS FOR CURATION:")
-        print("-" * 40)
+        lines.append("\n🎯 TOP PRIORITY ASSETS FOR CURATION:")
+        lines.append("-" * 40)
         for i, asset_data in enumerate(priority_assets, 1):
             score = asset_data.get("priority_score", 0)
             asset_name = asset_data.get("asset", "Unknown")
             q_count = asset_data.get("questions", 0)
-            print(f"  {i}. {asset_name}")
-            print(f"     Score: {score}/10 | Questions: {q_count}")
+            lines.append(f"  {i}. {asset_name}")
+            lines.append(f"     Score: {score}/10 | Questions: {q_count}")
 
     # Question type distribution
     dist = results.get("question_type_distribution", {})
-    top_types = sorted(dist.items(), key=lambda x: x[1], reverse=True)[:3]
+    top_types = nlargest(3, dist.items(), key=itemgetter(1))
     if top_types:
-        print("\n📈 TOP QUESTION TYPES:")
-        print("-" * 40)
+        lines.append("\n📈 TOP QUESTION TYPES:")
+        lines.append("-" * 40)
         for q_type, pct in top_types:
             if pct > 0:
                 bar = "█" * int(pct / 5)
-                print(f"  {q_type}: {pct}% {bar}")
+                lines.append(f"  {q_type}: {pct}% {bar}")
 
     # Metadata gaps
     gaps = results.get("metadata_gaps", [])
     high_severity = [g for g in gaps if g.get("severity") == "High"]
     if high_severity:
-        print("\n⚠️  HIGH SEVERITY GAPS:")
-        print("-" * 40)
+        lines.append("\n⚠️  HIGH SEVERITY GAPS:")
+        lines.append("-" * 40)
         for gap in high_severity:
-            print(f"  • {gap.get('gap_type')}: {gap.get('description')}")
+            lines.append(f"  • {gap.get('gap_type')}: {gap.get('description')}")
 
     # Agent recommendations summary
     recs = results.get("agent_recommendations", {})
-    print("\n🤖 AGENT OPPORTUNITIES:")
-    print("-" * 40)
-    print(f"  • Description Agent: {len(recs.get('description_agent', []))} assets ready")
-    print(f"  • Ownership Agent: {len(recs.get('ownership_agent', []))} assets with owners identified")
-    print(f"  • Quality Context Agent: {len(recs.get('quality_context_agent', []))} assets with caveats")
-    print(f"  • Glossary Linkage Agent: {len(recs.get('glossary_linkage_agent', []))} assets with terms")
+    lines.append("\n🤖 AGENT OPPORTUNITIES:")
+    lines.append("-" * 40)
+    lines.append(f"  • Description Agent: {len(recs.get('description_agent', []))} assets ready")
+    lines.append(f"  • Ownership Agent: {len(recs.get('ownership_agent', []))} assets with owners identified")
+    lines.append(f"  • Quality Context Agent: {len(recs.get('quality_context_agent', []))} assets with caveats")
+    lines.append(f"  • Glossary Linkage Agent: {len(recs.get('glossary_linkage_agent', []))} assets with terms")
+
+    lines.append("\n" + "=" * 60)
+    return "\n".join(lines)
+
 
-    print("\n" + "=" * 60)
+def print_summary(results: dict):
+    """Print a summary of the analysis to console in one write."""
+    sys.stdout.write(format_summary(results) + "\n")
 
 
 def analyze_channel(args):
     """Analyze a Slack channel for metadata gaps."""
+    from slack_client import SlackClient, SlackClientError
+    from slack_metadata_analyzer import SlackMetadataAnalyzer, format_markdown_report
+
     print_banner()
 
     channel = args.channel
@@ -142,27 +220,24 @@ def analyze_channel(args):
     # Run analysis
     print("\n🔬 Running analysis...")
     analyzer = SlackMetadataAnalyzer(messages_data)
-    results = analyzer.analyze()
+    results = analyzer.analyze(workers=getattr(args, 'workers', None))
 
     # Save results
-    os.makedirs(output_dir, exist_ok=True)
+    out = Path(output_dir)
+    out.mkdir(parents=True, exist_ok=True)
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     channel_safe = channel.lstrip("#").replace("-", "_")
 
     # Save JSON
-    json_path = os.path.join(output_dir, f"{channel_safe}_analysis_{timestamp}.json")
-    json_filename = os.path.basename(json_path)
-    with open(json_path, "w") as f:
-        json.dump(results, f, indent=2)
-    print(f"✓ JSON report: {json_filename}")
+    json_path = out / f"{channel_safe}_analysis_{timestamp}.json"
+    write_json_report(results, json_path)
+    print(f"✓ JSON report: {json_path.name}")
 
     # Save Markdown
     md_report = format_markdown_report(results)
-    md_path = os.path.join(output_dir, f"{channel_safe}_analysis_{timestamp}.md")
-    md_filename = os.path.basename(md_path)
-    with open(md_path, "w") as f:
-        f.write(md_report)
-    print(f"✓ Markdown report: {md_filename}")
+    md_path = json_path.with_suffix(".md")
+    md_path.write_text(md_report)
+    print(f"✓ Markdown report: {md_path.name}")
 
     # Print summary
     print_summary(results)
@@ -170,6 +245,8 @@ def analyze_channel(args):
 
 def analyze_file(args):
     """Analyze from an exported JSON file."""
+    from slack_metadata_analyzer import SlackMetadataAnalyzer, format_markdown_report
+
     print_banner()
 
     input_file = args.input
@@ -179,12 +256,11 @@ def analyze_file(args):
 
     # Load messages
     try:
-        with open(input_file, "r") as f:
-            messages_data = json.load(f)
+        messages_data = read_messages_file(input_file)
     except FileNotFoundError:
         print(f"❌ File not found: {input_file}")
         sys.exit(1)
-    except json.JSONDecodeError as e:
+    except ValueError as e:
         print(f"❌ Invalid JSON: {e}")
         sys.exit(1)
 
@@ -193,26 +269,23 @@ def analyze_file(args):
     # Run analysis
     print("\n🔬 Running analysis...")
     analyzer = SlackMetadataAnalyzer(messages_data)
-    results = analyzer.analyze()
+    results = analyzer.analyze(workers=getattr(args, 'workers', None))
 
     # Save results
-    os.makedirs(output_dir, exist_ok=True)
+    out = Path(output_dir)
+    out.mkdir(parents=True, exist_ok=True)
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
     # Save JSON
-    json_path = os.path.join(output_dir, f"analysis_{timestamp}.json")
-    json_filename = os.path.basename(json_path)
-    with open(json_path, "w") as f:
-        json.dump(results, f, indent=2)
-    print(f"✓ JSON report: {json_filename}")
+    json_path = out / f"analysis_{timestamp}.json"
+    write_json_report(results, json_path)
+    print(f"✓ JSON report: {json_path.name}")
 
     # Save Markdown
     md_report = format_markdown_report(results)
-    md_path = os.path.join(output_dir, f"analysis_{timestamp}.md")
-    md_filename = os.path.basename(md_path)
-    with open(md_path, "w") as f:
-        f.write(md_report)
-    print(f"✓ Markdown report: {md_filename}")
+    md_path = json_path.with_suffix(".md")
+    md_path.write_text(md_report)
+    print(f"✓ Markdown report: {md_path.name}")
 
     # Print summary
     print_summary(results)
@@ -220,13 +293,16 @@ def analyze_file(args):
 
 def analyze_transcript(args):
     """Analyze from a call transcript file."""
+    from slack_metadata_analyzer import SlackMetadataAnalyzer, format_markdown_report
+    from transcript_parser import parse_transcript_file
+
     print_banner()
 
     input_file = args.input
     output_dir = args.output
     title = args.title if hasattr(args, 'title') and args.title else None
 
-    print(f"📞 Reading transcript: {os.path.basename(input_file)}")
+    print(f"📞 Reading transcript: {Path(input_file).name}")
 
     # Parse transcript
     try:
@@ -243,26 +319,23 @@ def analyze_transcript(args):
     # Run analysis
     print("\n🔬 Running analysis...")
     analyzer = SlackMetadataAnalyzer(messages_data)
-    results = analyzer.analyze()
+    results = analyzer.analyze(workers=getattr(args, 'workers', None))
 
     # Save results
-    os.makedirs(output_dir, exist_ok=True)
+    out = Path(output_dir)
+    out.mkdir(parents=True, exist_ok=True)
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
     # Save JSON
-    json_path = os.path.join(output_dir, f"transcript_analysis_{timestamp}.json")
-    json_filename = os.path.basename(json_path)
-    with open(json_path, "w") as f:
-        json.dump(results, f, indent=2)
-    print(f"✓ JSON report: {json_filename}")
+    json_path = out / f"transcript_analysis_{timestamp}.json"
+    write_json_report(results, json_path)
+    print(f"✓ JSON report: {json_path.name}")
 
     # Save Markdown
     md_report = format_markdown_report(results)
-    md_path = os.path.join(output_dir, f"transcript_analysis_{timestamp}.md")
-    md_filename = os.path.basename(md_path)
-    with open(md_path, "w") as f:
-        f.write(md_report)
-    print(f"✓ Markdown report: {md_filename}")
+    md_path = json_path.with_suffix(".md")
+    md_path.write_text(md_report)
+    print(f"✓ Markdown report: {md_path.name}")
 
     # Print summary
     print_summary(results)
@@ -270,6 +343,8 @@ def analyze_transcript(args):
 
 def cmd_test_connection(args):
     """Test Slack API connection."""
+    from slack_client import test_connection
+
     print_banner()
     print("Testing Slack connection...\n")
 
@@ -292,6 +367,8 @@ def cmd_test_connection(args):
 
 def interactive_mode():
     """Run in interactive mode."""
+    from slack_client import test_connection
+
     print_banner()
     print("Welcome! Let's analyze your Slack channel for metadata gaps.\n")
 
@@ -406,6 +483,11 @@ Environment Variables:
         default=500,
         help="Maximum messages to analyze (default: 500)"
     )
+    analyze_parser.add_argument(
+        "--workers", "-w",
+        type=int,
+        help="Worker processes for analysis (default: CPU count)"
+    )
 
     # analyze-file command
     file_parser = subparsers.add_parser(
@@ -422,6 +504,11 @@ Environment Variables:
         default="./reports",
         help="Output directory for reports (default: ./reports)"
     )
+    file_parser.add_argument(
+        "--workers", "-w",
+        type=int,
+        help="Worker processes for analysis (default: CPU count)"
+    )
 
     # analyze-transcript command
     transcript_parser = subparsers.add_parser(
@@ -442,6 +529,11 @@ Environment Variables:
         "--title", "-t",
         help="Title for the transcript (default: filename)"
     )
+    transcript_parser.add_argument(
+        "--workers", "-w",
+        type=int,
+        help="Worker processes for analysis (default: CPU count)"
+    )
 
     # test-connection command
     subparsers.add_parser(
@@ -5,47 +5,46 @@ This package extracts temporal/historical data from Salesforce and processes it
 into standardized MicroDecisionEvent records for integration with Atlan.
 """
 
+import importlib
+
 __version__ = "0.1.0"
 
-from salesforce_temporal.extractors.activity import ActivityExtractor
-from salesforce_temporal.extractors.approval_history import ApprovalHistoryExtractor
-from salesforce_temporal.extractors.base import BaseExtractor
-from salesforce_temporal.extractors.field_history import (
-    FieldHistoryExtractor,
-    create_account_history_extractor,
-    create_case_history_extractor,
-    create_contact_history_extractor,
-    create_lead_history_extractor,
-    create_opportunity_field_history_extractor,
-)
-from salesforce_temporal.extractors.opportunity_history import OpportunityHistoryExtractor
-from salesforce_temporal.extractors.setup_audit_trail import SetupAuditTrailExtractor
-from salesforce_temporal.models.events import (
-    ActorType,
-    EventContext,
-    EventType,
-    MicroDecisionEvent,
-)
-
-__all__ = [
-    # Version
-    "__version__",
+# Lazy re-exports (PEP 562): importing the package doesn't pull in
+# simple-salesforce, pydantic settings and every extractor module until a
+# name is actually used, keeping `import salesforce_temporal` (and CLI
+# --help) fast.
+_LAZY_IMPORTS = {
     # Event Models
-    "MicroDecisionEvent",
-    "EventContext",
-    "EventType",
-    "ActorType",
+    "MicroDecisionEvent": "salesforce_temporal.models.events",
+    "EventContext": "salesforce_temporal.models.events",
+    "EventType": "salesforce_temporal.models.events",
+    "ActorType": "salesforce_temporal.models.events",
     # Extractors
-    "BaseExtractor",
-    "OpportunityHistoryExtractor",
-    "FieldHistoryExtractor",
-    "ApprovalHistoryExtractor",
-    "ActivityExtractor",
-    "SetupAuditTrailExtractor",
+    "BaseExtractor": "salesforce_temporal.extractors.base",
+    "OpportunityHistoryExtractor": "salesforce_temporal.extractors.opportunity_history",
+    "FieldHistoryExtractor": "salesforce_temporal.extractors.field_history",
+    "ApprovalHistoryExtractor": "salesforce_temporal.extractors.approval_history",
+    "ActivityExtractor": "salesforce_temporal.extractors.activity",
+    "SetupAuditTrailExtractor": "salesforce_temporal.extractors.setup_audit_trail",
     # Factory Functions
-    "create_opportunity_field_history_extractor",
-    "create_account_history_extractor",
-    "create_case_history_extractor",
-    "create_lead_history_extractor",
-    "create_contact_history_extractor",
-]
+    "create_opportunity_field_history_extractor": "salesforce_temporal.extractors.field_history",
+    "create_account_history_extractor": "salesforce_temporal.extractors.field_history",
+    "create_case_history_extractor": "salesforce_temporal.extractors.field_history",
+    "create_lead_history_extractor": "salesforce_temporal.extractors.field_history",
+    "create_contact_history_extractor": "salesforce_temporal.extractors.field_history",
+}
+
+__all__ = ["__version__", *_LAZY_IMPORTS]
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(__all__)
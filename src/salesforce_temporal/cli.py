@@ -13,19 +13,28 @@ Usage:
 """
 
 import argparse
+import csv
 import json
 import logging
+import re
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import List
+from typing import Final, List
 
-from salesforce_temporal.config.settings import get_settings
-from salesforce_temporal.extractors.activity import ActivityExtractor
-from salesforce_temporal.extractors.approval_history import ApprovalHistoryExtractor
-from salesforce_temporal.extractors.field_history import FieldHistoryExtractor
-from salesforce_temporal.extractors.opportunity_history import OpportunityHistoryExtractor
-from salesforce_temporal.extractors.setup_audit_trail import SetupAuditTrailExtractor
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Extractor modules (and their simple-salesforce/pydantic dependencies) are
+# imported inside each command function, so `sf-temporal --help` and argument
+# parsing stay fast.
 
 # Setup logging
 logging.basicConfig(
@@ -34,6 +43,23 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Output directories already created this run; saves a stat/mkdir per
+# EventWriter when many files land in the same place
+_CREATED_DIRS = set()
+
+# Map common names to actual history object names; shared (read-only)
+# across the extract-all worker threads
+_OBJECT_MAP: Final[dict] = {
+    "opportunity": ("OpportunityFieldHistory", "Opportunity"),
+    "account": ("AccountHistory", "Account"),
+    "case": ("CaseHistory", "Case"),
+    "lead": ("LeadHistory", "Lead"),
+    "contact": ("ContactHistory", "Contact"),
+}
+
+# Strips the History/FieldHistory suffix from custom history object names
+_HIST_SUFFIX_RE = re.compile(r"(Field)?History$")
+
 
 def explore_salesforce_command(args):
     """Run Salesforce exploration."""
@@ -53,21 +79,24 @@ def extract_opportunity_history(args):
     """Extract opportunity history."""
     logger.info("Extracting OpportunityHistory...")
 
+    from salesforce_temporal.extractors.opportunity_history import OpportunityHistoryExtractor
+
     extractor = OpportunityHistoryExtractor()
-    events = []
+    output_file = args.output or f"opportunity_history_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.jsonl"
 
     try:
-        for event in extractor.extract_events(incremental=args.incremental):
-            events.append(event.to_dict())
+        # Stream events straight to disk instead of accumulating a list
+        with EventWriter(output_file, args.format, args.compress) as writer:
+            for event in extractor.extract_events(incremental=args.incremental):
+                writer.write_model(event)
 
-            if args.limit and len(events) >= args.limit:
-                break
+                if args.limit and writer.count >= args.limit:
+                    break
 
-        # Save to output file
-        output_file = args.output or f"opportunity_history_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.jsonl"
-        save_events(events, output_file, args.format)
+            count = writer.count
+            output_path = writer.path
 
-        logger.info(f"Extracted {len(events)} events to {output_file}")
+        logger.info(f"Extracted {count} events to {output_path}")
 
     except Exception as e:
         logger.error(f"Extraction failed: {e}")
@@ -78,24 +107,16 @@ def extract_field_history(args):
     """Extract field history for a specific object."""
     logger.info(f"Extracting {args.object}...")
 
-    # Map common names to actual history object names
-    object_map = {
-        "opportunity": ("OpportunityFieldHistory", "Opportunity"),
-        "account": ("AccountHistory", "Account"),
-        "case": ("CaseHistory", "Case"),
-        "lead": ("LeadHistory", "Lead"),
-        "contact": ("ContactHistory", "Contact"),
-    }
-
-    if args.object.lower() in object_map:
-        history_obj, parent_obj = object_map[args.object.lower()]
-    else:
-        # Assume custom object format
-        history_obj = args.object
-        parent_obj = args.object.replace("History", "").replace("FieldHistory", "")
+    # Custom objects fall back to stripping their History suffix
+    history_obj, parent_obj = _OBJECT_MAP.get(
+        args.object.casefold(),
+        (args.object, _HIST_SUFFIX_RE.sub("", args.object)),
+    )
+
+    from salesforce_temporal.extractors.field_history import FieldHistoryExtractor
 
     extractor = FieldHistoryExtractor(history_obj, parent_obj)
-    events = []
+    output_file = args.output or f"{history_obj}_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.jsonl"
 
     try:
         if args.field:
@@ -105,17 +126,18 @@ def extract_field_history(args):
             # Extract all fields
             event_iter = extractor.extract_events(incremental=args.incremental)
 
-        for event in event_iter:
-            events.append(event.to_dict())
+        # Stream events straight to disk instead of accumulating a list
+        with EventWriter(output_file, args.format, args.compress) as writer:
+            for event in event_iter:
+                writer.write_model(event)
 
-            if args.limit and len(events) >= args.limit:
-                break
+                if args.limit and writer.count >= args.limit:
+                    break
 
-        # Save to output file
-        output_file = args.output or f"{history_obj}_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.jsonl"
-        save_events(events, output_file, args.format)
+            count = writer.count
+            output_path = writer.path
 
-        logger.info(f"Extracted {len(events)} events to {output_file}")
+        logger.info(f"Extracted {count} events to {output_path}")
 
     except Exception as e:
         logger.error(f"Extraction failed: {e}")
@@ -126,21 +148,24 @@ def extract_approval_history(args):
     """Extract approval history."""
     logger.info("Extracting ApprovalHistory...")
 
+    from salesforce_temporal.extractors.approval_history import ApprovalHistoryExtractor
+
     extractor = ApprovalHistoryExtractor()
-    events = []
+    output_file = args.output or f"approval_history_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.jsonl"
 
     try:
-        for event in extractor.extract_events(incremental=args.incremental):
-            events.append(event.to_dict())
+        # Stream events straight to disk instead of accumulating a list
+        with EventWriter(output_file, args.format, args.compress) as writer:
+            for event in extractor.extract_events(incremental=args.incremental):
+                writer.write_model(event)
 
-            if args.limit and len(events) >= args.limit:
-                break
+                if args.limit and writer.count >= args.limit:
+                    break
 
-        # Save to output file
-        output_file = args.output or f"approval_history_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.jsonl"
-        save_events(events, output_file, args.format)
+            count = writer.count
+            output_path = writer.path
 
-        logger.info(f"Extracted {len(events)} events to {output_file}")
+        logger.info(f"Extracted {count} events to {output_path}")
 
     except Exception as e:
         logger.error(f"Extraction failed: {e}")
@@ -151,25 +176,28 @@ def extract_activity(args):
     """Extract activity (Task and Event) records."""
     logger.info("Extracting Activity...")
 
+    from salesforce_temporal.extractors.activity import ActivityExtractor
+
     extractor = ActivityExtractor()
-    events = []
+    output_file = args.output or f"activity_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.jsonl"
 
     try:
-        for event in extractor.extract_events(
-            incremental=args.incremental,
-            extract_tasks=not args.events_only,
-            extract_events=not args.tasks_only,
-        ):
-            events.append(event.to_dict())
+        # Stream events straight to disk instead of accumulating a list
+        with EventWriter(output_file, args.format, args.compress) as writer:
+            for event in extractor.extract_events(
+                incremental=args.incremental,
+                extract_tasks=not args.events_only,
+                extract_events=not args.tasks_only,
+            ):
+                writer.write_model(event)
 
-            if args.limit and len(events) >= args.limit:
-                break
+                if args.limit and writer.count >= args.limit:
+                    break
 
-        # Save to output file
-        output_file = args.output or f"activity_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.jsonl"
-        save_events(events, output_file, args.format)
+            count = writer.count
+            output_path = writer.path
 
-        logger.info(f"Extracted {len(events)} events to {output_file}")
+        logger.info(f"Extracted {count} events to {output_path}")
 
     except Exception as e:
         logger.error(f"Extraction failed: {e}")
@@ -180,30 +208,258 @@ def extract_setup_audit_trail(args):
     """Extract setup audit trail."""
     logger.info("Extracting SetupAuditTrail...")
 
+    from salesforce_temporal.extractors.setup_audit_trail import SetupAuditTrailExtractor
+
     extractor = SetupAuditTrailExtractor()
-    events = []
+    output_file = args.output or f"setup_audit_trail_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.jsonl"
 
     try:
-        for event in extractor.extract_events(
-            incremental=args.incremental,
-            lookback_days=args.lookback_days,
-        ):
-            events.append(event.to_dict())
+        # Stream events straight to disk instead of accumulating a list
+        with EventWriter(output_file, args.format, args.compress) as writer:
+            for event in extractor.extract_events(
+                incremental=args.incremental,
+                lookback_days=args.lookback_days,
+            ):
+                writer.write_model(event)
 
-            if args.limit and len(events) >= args.limit:
-                break
+                if args.limit and writer.count >= args.limit:
+                    break
 
-        # Save to output file
-        output_file = args.output or f"setup_audit_trail_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.jsonl"
-        save_events(events, output_file, args.format)
+            count = writer.count
+            output_path = writer.path
 
-        logger.info(f"Extracted {len(events)} events to {output_file}")
+        logger.info(f"Extracted {count} events to {output_path}")
 
     except Exception as e:
         logger.error(f"Extraction failed: {e}")
         sys.exit(1)
 
 
+def extract_all(args):
+    """Run every extractor concurrently, each writing its own file.
+
+    The extractors are IO-bound on Salesforce round trips and hit
+    distinct endpoints, so threads overlap their wait time and total
+    wall time approaches that of the slowest extractor.
+    """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    jobs = [
+        ("opportunity-history", extract_opportunity_history, {}),
+        ("approval-history", extract_approval_history, {}),
+        ("activity", extract_activity,
+         {"tasks_only": False, "events_only": False}),
+        ("setup-audit-trail", extract_setup_audit_trail,
+         {"lookback_days": None}),
+    ]
+    for obj in _OBJECT_MAP:
+        jobs.append((f"field-history/{obj}", extract_field_history,
+                     {"object": obj, "field": None}))
+
+    failures = []
+    with ThreadPoolExecutor(max_workers=args.parallel) as executor:
+        futures = {}
+        for name, func, extra in jobs:
+            # Each job gets its own namespace with default output naming
+            job_args = argparse.Namespace(**{**vars(args), "output": None, **extra})
+            futures[executor.submit(func, job_args)] = name
+
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                future.result()
+            except SystemExit:
+                # The extract commands exit(1) on failure; collect and
+                # report instead of killing the whole run
+                failures.append(name)
+            except Exception as e:
+                logger.error(f"{name} failed: {e}")
+                failures.append(name)
+
+    if failures:
+        logger.error(f"Extractors failed: {', '.join(sorted(failures))}")
+        sys.exit(1)
+
+    logger.info(f"All {len(jobs)} extractors completed")
+
+
+class EventWriter:
+    """
+    Stream events to a file in the specified format.
+
+    Serializes each event as it is written, so extraction runs hold one
+    event in memory at a time instead of the full list. Use as a context
+    manager:
+
+        with EventWriter(output_file, "jsonl") as writer:
+            for event in extractor.extract_events():
+                writer.write_model(event)
+    """
+
+    # Accumulate serialized events up to this many bytes before hitting
+    # the file object, so large jsonl runs do ~1 write per MiB instead of
+    # one per event
+    BUFFER_LIMIT = 1 << 20
+
+    # Let orjson format datetime values in C rather than bouncing each
+    # one through a Python-level default=str call
+    ORJSON_OPTS = (orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z) if orjson else 0
+
+    def __init__(self, output_file: str, format: str = "jsonl",
+                 compress: str = "none"):
+        if format not in ("jsonl", "json", "csv"):
+            raise ValueError(f"Unsupported format: {format}")
+        if compress not in ("none", "zstd", "gzip"):
+            raise ValueError(f"Unsupported compression: {compress}")
+        if compress == "zstd" and zstandard is None:
+            raise ValueError(
+                "zstd compression requires the zstandard package"
+            )
+
+        self.format = format
+        self.count = 0
+        self._csv_writer = None
+        self._buffer = None
+        self._raw_file = None
+
+        output_path = Path(output_file)
+        suffix = {"zstd": ".zst", "gzip": ".gz"}.get(compress)
+        if suffix and output_path.suffix != suffix:
+            output_path = output_path.with_name(output_path.name + suffix)
+        self.path = output_path
+
+        parent = output_path.parent
+        if parent not in _CREATED_DIRS:
+            parent.mkdir(parents=True, exist_ok=True)
+            _CREATED_DIRS.add(parent)
+
+        # Pick the byte sink: plain file or a streaming compressor.
+        # Repeated field names and ISO timestamps compress 5-10x, turning
+        # an IO-bound write into a much smaller one.
+        if compress == "zstd":
+            self._raw_file = open(output_path, "wb", buffering=self.BUFFER_LIMIT)
+            # threads=-1 offloads compression to worker threads, which
+            # overlaps with Python producing the JSON bytes
+            self._file = zstandard.ZstdCompressor(
+                level=3, threads=-1
+            ).stream_writer(self._raw_file)
+            self._binary = True
+        elif compress == "gzip":
+            import gzip
+            self._file = gzip.open(output_path, "wb")
+            self._binary = True
+        elif format == "csv":
+            self._file = open(output_path, "w", newline="", buffering=self.BUFFER_LIMIT)
+            self._binary = False
+        elif orjson is not None:
+            # orjson serializes ~3-5x faster than stdlib json and works in
+            # binary mode, avoiding per-event string concatenation
+            self._file = open(output_path, "wb", buffering=self.BUFFER_LIMIT)
+            self._binary = True
+        else:
+            self._file = open(output_path, "w", buffering=self.BUFFER_LIMIT)
+            self._binary = False
+
+        # Formats that need text (csv always; json/jsonl without orjson)
+        # get a text wrapper over the compressed binary stream
+        if self._binary and (format == "csv" or orjson is None):
+            import io
+            self._file = io.TextIOWrapper(self._file, newline="" if format == "csv" else None)
+            self._binary = False
+
+        if self._binary and format == "jsonl":
+            self._buffer = bytearray()
+
+        if format == "json":
+            self._write_raw("[\n")
+
+    def _write_raw(self, text: str):
+        self._file.write(text.encode() if self._binary else text)
+
+    def _serialize(self, event: dict, newline: bool = False):
+        if orjson is not None:
+            option = self.ORJSON_OPTS | (orjson.OPT_APPEND_NEWLINE if newline else 0)
+            # default=str matches the stdlib fallback so types orjson
+            # can't serialize natively (Decimal, sets, ...) still land
+            # as strings instead of raising
+            self._file.write(orjson.dumps(event, option=option, default=str))
+        else:
+            self._file.write(json.dumps(event, default=str) + ("\n" if newline else ""))
+
+    def write(self, event: dict):
+        """Write a single event dictionary."""
+        if self.format == "jsonl":
+            if self._buffer is not None:
+                self._buffer += orjson.dumps(
+                    event,
+                    option=self.ORJSON_OPTS | orjson.OPT_APPEND_NEWLINE,
+                    default=str,
+                )
+                if len(self._buffer) >= self.BUFFER_LIMIT:
+                    self._file.write(self._buffer)
+                    self._buffer.clear()
+            else:
+                self._serialize(event, newline=True)
+
+        elif self.format == "json":
+            if self.count:
+                self._write_raw(",\n")
+            self._serialize(event)
+
+        else:  # csv
+            if self._csv_writer is None:
+                self._csv_writer = csv.DictWriter(
+                    self._file, fieldnames=list(event.keys()), extrasaction="ignore"
+                )
+                self._csv_writer.writeheader()
+            self._csv_writer.writerow(event)
+
+        self.count += 1
+
+    def write_model(self, event):
+        """Write a pydantic event, serializing straight to JSON bytes.
+
+        Skips the intermediate to_dict() dict for jsonl/json output; csv
+        still needs the dict to derive its columns.
+        """
+        if self.format == "csv":
+            self.write(event.to_dict())
+            return
+
+        payload = event.to_json_bytes()
+        if self.format == "json":
+            if self.count:
+                self._write_raw(",\n")
+            self._file.write(payload if self._binary else payload.decode())
+        elif self._buffer is not None:
+            self._buffer += payload
+            self._buffer += b"\n"
+            if len(self._buffer) >= self.BUFFER_LIMIT:
+                self._file.write(self._buffer)
+                self._buffer.clear()
+        elif self._binary:
+            self._file.write(payload + b"\n")
+        else:
+            self._file.write(payload.decode() + "\n")
+        self.count += 1
+
+    def close(self):
+        if self._buffer:
+            self._file.write(self._buffer)
+            self._buffer.clear()
+        if self.format == "json":
+            self._write_raw("\n]\n" if self.count else "]\n")
+        self._file.close()
+        if self._raw_file is not None and not self._raw_file.closed:
+            self._raw_file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
 def save_events(events: List[dict], output_file: str, format: str = "jsonl"):
     """
     Save events to file in specified format.
@@ -213,26 +469,9 @@ def save_events(events: List[dict], output_file: str, format: str = "jsonl"):
         output_file: Output file path
         format: Output format (jsonl, json, csv)
     """
-    output_path = Path(output_file)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-
-    if format == "jsonl":
-        with open(output_path, "w") as f:
-            for event in events:
-                f.write(json.dumps(event, default=str) + "\n")
-
-    elif format == "json":
-        with open(output_path, "w") as f:
-            json.dump(events, f, indent=2, default=str)
-
-    elif format == "csv":
-        import pandas as pd
-
-        df = pd.DataFrame(events)
-        df.to_csv(output_path, index=False)
-
-    else:
-        raise ValueError(f"Unsupported format: {format}")
+    with EventWriter(output_file, format) as writer:
+        for event in events:
+            writer.write(event)
 
 
 def main():
@@ -260,6 +499,7 @@ def main():
         parser.add_argument("--incremental", action="store_true", help="Incremental extraction")
         parser.add_argument("--output", "-o", help="Output file path")
         parser.add_argument("--format", choices=["jsonl", "json", "csv"], default="jsonl", help="Output format")
+        parser.add_argument("--compress", choices=["none", "zstd", "gzip"], default="none", help="Compress output on the fly")
         parser.add_argument("--limit", type=int, help="Maximum number of events to extract")
 
     # OpportunityHistory
@@ -292,6 +532,12 @@ def main():
     add_common_args(setup_parser)
     setup_parser.set_defaults(func=extract_setup_audit_trail)
 
+    # All extractors concurrently
+    all_parser = extract_subparsers.add_parser("all", help="Run every extractor concurrently")
+    all_parser.add_argument("--parallel", type=int, default=4, help="Maximum concurrent extractors (default: 4)")
+    add_common_args(all_parser)
+    all_parser.set_defaults(func=extract_all)
+
     # Parse and execute
     args = parser.parse_args()
 
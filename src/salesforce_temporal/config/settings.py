@@ -5,10 +5,42 @@ This module uses pydantic-settings to manage configuration from environment
 variables with validation and type safety.
 """
 
+import os
+from functools import cached_property, lru_cache
 from typing import Optional
 
 from pydantic import Field, field_validator
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic_settings import BaseSettings, InitSettingsSource, SettingsConfigDict
+
+# Parsed .env contents, read at most once per process. Every Settings()
+# construction otherwise re-opens and re-parses the file through
+# pydantic-settings' dotenv source.
+_DOTENV_CACHE: Optional[dict] = None
+
+
+def _load_dotenv_cache() -> dict:
+    """Parse .env once and serve every Settings() from memory."""
+    global _DOTENV_CACHE
+    if _DOTENV_CACHE is None:
+        if os.path.exists(".env"):
+            from dotenv import dotenv_values
+
+            _DOTENV_CACHE = {
+                key.lower(): value
+                for key, value in dotenv_values(".env").items()
+                if value is not None
+            }
+        else:
+            _DOTENV_CACHE = {}
+    return _DOTENV_CACHE
+
+
+# Allowed values for validated fields. Hoisted to module scope as frozensets
+# so each Settings() construction does a hash lookup instead of allocating
+# and scanning a list literal per field.
+_VALID_DOMAINS = frozenset({"login", "test"})
+_VALID_FORMATS = frozenset({"jsonl", "parquet", "csv"})
+_VALID_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
 
 
 class Settings(BaseSettings):
@@ -44,6 +76,22 @@ class Settings(BaseSettings):
         extra="ignore",
     )
 
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls,
+        init_settings,
+        env_settings,
+        dotenv_settings,
+        file_secret_settings,
+    ):
+        """Serve dotenv values from the module cache instead of re-reading
+        .env on every construction; precedence is unchanged."""
+        cached_dotenv = InitSettingsSource(
+            settings_cls, init_kwargs=_load_dotenv_cache()
+        )
+        return (init_settings, env_settings, cached_dotenv, file_secret_settings)
+
     # Salesforce OAuth Configuration
     salesforce_username: Optional[str] = Field(
         None, description="Salesforce username for authentication"
@@ -73,8 +121,12 @@ class Settings(BaseSettings):
     )
 
     # Atlan Configuration
-    atlan_base_url: str = Field(..., description="Atlan instance base URL")
-    atlan_api_key: str = Field(..., description="Atlan API key for authentication")
+    # Optional so Salesforce-only scripts can construct Settings without an
+    # Atlan tenant configured; atlan_config raises on first access if unset.
+    atlan_base_url: Optional[str] = Field(None, description="Atlan instance base URL")
+    atlan_api_key: Optional[str] = Field(
+        None, description="Atlan API key for authentication"
+    )
 
     # Extraction Configuration
     bulk_api_batch_size: int = Field(
@@ -120,7 +172,7 @@ class Settings(BaseSettings):
     @classmethod
     def validate_domain(cls, v: str) -> str:
         """Ensure domain is valid."""
-        if v not in ["login", "test"]:
+        if v not in _VALID_DOMAINS:
             raise ValueError("salesforce_domain must be 'login' or 'test'")
         return v
 
@@ -128,7 +180,7 @@ class Settings(BaseSettings):
     @classmethod
     def validate_output_format(cls, v: str) -> str:
         """Ensure output format is supported."""
-        if v not in ["jsonl", "parquet", "csv"]:
+        if v not in _VALID_FORMATS:
             raise ValueError("output_format must be 'jsonl', 'parquet', or 'csv'")
         return v
 
@@ -136,14 +188,22 @@ class Settings(BaseSettings):
     @classmethod
     def validate_log_level(cls, v: str) -> str:
         """Ensure log level is valid."""
-        valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
+        if v in _VALID_LEVELS:
+            # Already canonical uppercase; skip the .upper() round trip.
+            return v
         v_upper = v.upper()
-        if v_upper not in valid_levels:
-            raise ValueError(f"log_level must be one of {valid_levels}")
+        if v_upper not in _VALID_LEVELS:
+            raise ValueError(f"log_level must be one of {sorted(_VALID_LEVELS)}")
         return v_upper
 
-    def get_salesforce_auth_config(self) -> dict:
-        """Get Salesforce authentication configuration."""
+    @cached_property
+    def salesforce_auth_config(self) -> dict:
+        """Salesforce authentication configuration.
+
+        Computed once per instance; Settings is effectively immutable after
+        construction, so the auth-mode branch and dict build are not repeated
+        on every connect.
+        """
         if self.salesforce_consumer_key and self.salesforce_private_key_path:
             # JWT authentication
             return {
@@ -166,26 +226,36 @@ class Settings(BaseSettings):
                 "(username + consumer_key + private_key_path) for Salesforce auth"
             )
 
-    def get_atlan_config(self) -> dict:
-        """Get Atlan configuration."""
+    @cached_property
+    def atlan_config(self) -> dict:
+        """Atlan configuration, computed once per instance."""
+        if not (self.atlan_base_url and self.atlan_api_key):
+            raise ValueError(
+                "Must provide ATLAN_BASE_URL and ATLAN_API_KEY for Atlan access"
+            )
         return {
             "base_url": self.atlan_base_url,
             "api_key": self.atlan_api_key,
         }
 
+    def get_salesforce_auth_config(self) -> dict:
+        """Get Salesforce authentication configuration."""
+        return self.salesforce_auth_config
 
-# Global settings instance
-_settings: Optional[Settings] = None
+    def get_atlan_config(self) -> dict:
+        """Get Atlan configuration."""
+        return self.atlan_config
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """
     Get or create the global settings instance.
 
+    Memoized with lru_cache, so repeat calls are a C-level cache hit;
+    tests can call ``get_settings.cache_clear()`` to force a reload.
+
     Returns:
         Settings: The application settings
     """
-    global _settings
-    if _settings is None:
-        _settings = Settings()
-    return _settings
+    return Settings()
@@ -12,8 +12,17 @@ Usage:
 
 import json
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from operator import attrgetter
 from typing import Any, Dict, List
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from pyatlan.client.atlan import AtlanClient
 from pyatlan.model.assets import Asset, SalesforceObject, SalesforceOrganization
 from pyatlan.model.enums import AtlanConnectorType
@@ -21,14 +30,28 @@ from pyatlan.model.search import DSL, Bool, Term
 
 from salesforce_temporal.config.settings import get_settings
 
+# Section separator, built once instead of per print call.
+_SEP = "=" * 60
+
+# Resolves all inspected asset attributes in one C-level pass instead of
+# six Python-level getattr calls per asset.
+_ASSET_FIELDS = attrgetter(
+    "name", "type_name", "qualified_name", "guid", "description", "certificate_status"
+)
+
 
 class AtlanExplorer:
     """Explore Atlan SDK and validate catalog access."""
 
+    __slots__ = ("settings", "client", "_print_lock")
+
     def __init__(self):
         """Initialize Atlan client."""
         self.settings = get_settings()
         self.client: AtlanClient | None = None
+        # Keeps each method's console block atomic when the list methods
+        # run concurrently in run_exploration.
+        self._print_lock = threading.Lock()
 
     def connect(self) -> bool:
         """
@@ -38,7 +61,7 @@ class AtlanExplorer:
             bool: True if connection successful
         """
         try:
-            config = self.settings.get_atlan_config()
+            config = self.settings.atlan_config
             print(f"Connecting to Atlan: {config['base_url']}...")
 
             self.client = AtlanClient(
@@ -64,10 +87,6 @@ class AtlanExplorer:
             List of Salesforce assets
         """
         try:
-            print(f"\n{'='*60}")
-            print("Salesforce Assets in Catalog")
-            print(f"{'='*60}")
-
             # Search for Salesforce assets
             search_request = (
                 DSL.with_type(SalesforceObject)
@@ -81,17 +100,24 @@ class AtlanExplorer:
             )
 
             response = self.client.asset.search(search_request)
-            assets = list(response)
-
-            print(f"✓ Found {len(assets)} Salesforce assets")
-
-            if assets:
-                print("\nSample assets:")
-                for i, asset in enumerate(assets[:10], 1):
-                    print(f"  {i}. {asset.name} ({asset.type_name})")
-                    print(f"     Qualified Name: {asset.qualified_name}")
-                    if hasattr(asset, "description") and asset.description:
-                        print(f"     Description: {asset.description[:60]}...")
+            # Consume at most one page; forcing full pagination would pull
+            # every asset into memory when only a sample is displayed.
+            assets = list(islice(response, 50))
+            total = getattr(response, "count", None) or len(assets)
+
+            with self._print_lock:
+                print(f"\n{_SEP}")
+                print("Salesforce Assets in Catalog")
+                print(_SEP)
+                print(f"✓ Found {total} Salesforce assets")
+
+                if assets:
+                    print("\nSample assets:")
+                    for i, asset in enumerate(assets[:10], 1):
+                        print(f"  {i}. {asset.name} ({asset.type_name})")
+                        print(f"     Qualified Name: {asset.qualified_name}")
+                        if hasattr(asset, "description") and asset.description:
+                            print(f"     Description: {asset.description[:60]}...")
 
             return assets
 
@@ -107,10 +133,6 @@ class AtlanExplorer:
             List of Salesforce organization assets
         """
         try:
-            print(f"\n{'='*60}")
-            print("Salesforce Organizations")
-            print(f"{'='*60}")
-
             search_request = (
                 DSL.with_type(SalesforceOrganization)
                 .page_size(50)
@@ -118,14 +140,19 @@ class AtlanExplorer:
             )
 
             response = self.client.asset.search(search_request)
-            orgs = list(response)
+            orgs = list(islice(response, 50))
+            total = getattr(response, "count", None) or len(orgs)
 
-            print(f"✓ Found {len(orgs)} Salesforce organization(s)")
+            with self._print_lock:
+                print(f"\n{_SEP}")
+                print("Salesforce Organizations")
+                print(_SEP)
+                print(f"✓ Found {total} Salesforce organization(s)")
 
-            for i, org in enumerate(orgs, 1):
-                print(f"\n  {i}. {org.name}")
-                print(f"     Connection: {org.connection_qualified_name}")
-                print(f"     Qualified Name: {org.qualified_name}")
+                for i, org in enumerate(orgs, 1):
+                    print(f"\n  {i}. {org.name}")
+                    print(f"     Connection: {org.connection_qualified_name}")
+                    print(f"     Qualified Name: {org.qualified_name}")
 
             return orgs
 
@@ -141,10 +168,6 @@ class AtlanExplorer:
             List of custom metadata definitions
         """
         try:
-            print(f"\n{'='*60}")
-            print("Custom Metadata Definitions")
-            print(f"{'='*60}")
-
             # Get custom metadata defs via the typedef endpoint
             typedefs = self.client.typedef.get_all()
 
@@ -153,16 +176,20 @@ class AtlanExplorer:
                 if td.name.startswith("salesforce") or td.name.startswith("temporal")
             ]
 
-            print(f"✓ Found {len(custom_metadata)} relevant custom metadata definitions")
-
-            if custom_metadata:
-                print("\nRelevant custom metadata:")
-                for i, cmd in enumerate(custom_metadata, 1):
-                    print(f"  {i}. {cmd.name}")
-                    print(f"     Display Name: {cmd.display_name}")
-                    print(f"     Description: {cmd.description or 'N/A'}")
-                    if cmd.attribute_defs:
-                        print(f"     Attributes: {len(cmd.attribute_defs)}")
+            with self._print_lock:
+                print(f"\n{_SEP}")
+                print("Custom Metadata Definitions")
+                print(_SEP)
+                print(f"✓ Found {len(custom_metadata)} relevant custom metadata definitions")
+
+                if custom_metadata:
+                    print("\nRelevant custom metadata:")
+                    for i, cmd in enumerate(custom_metadata, 1):
+                        print(f"  {i}. {cmd.name}")
+                        print(f"     Display Name: {cmd.display_name}")
+                        print(f"     Description: {cmd.description or 'N/A'}")
+                        if cmd.attribute_defs:
+                            print(f"     Attributes: {len(cmd.attribute_defs)}")
 
             return custom_metadata
 
@@ -178,9 +205,9 @@ class AtlanExplorer:
             bool: True if operations successful
         """
         try:
-            print(f"\n{'='*60}")
+            print(f"\n{_SEP}")
             print("Testing Custom Metadata Operations")
-            print(f"{'='*60}")
+            print(_SEP)
 
             test_metadata_name = "temporal_data_test"
 
@@ -213,20 +240,34 @@ class AtlanExplorer:
         Returns:
             Dictionary with asset details
         """
+        try:
+            name, type_name, qualified_name, guid, description, certificate_status = (
+                _ASSET_FIELDS(asset)
+            )
+        except AttributeError:
+            # Asset types without the optional attributes fall back to the
+            # defaulted lookups.
+            name = asset.name
+            type_name = asset.type_name
+            qualified_name = asset.qualified_name
+            guid = asset.guid
+            description = getattr(asset, "description", None)
+            certificate_status = getattr(asset, "certificate_status", None)
+
         details = {
-            "name": asset.name,
-            "type": asset.type_name,
-            "qualified_name": asset.qualified_name,
-            "guid": asset.guid,
-            "description": getattr(asset, "description", None),
-            "certificate_status": getattr(asset, "certificate_status", None),
+            "name": name,
+            "type": type_name,
+            "qualified_name": qualified_name,
+            "guid": guid,
+            "description": description,
+            "certificate_status": certificate_status,
             "custom_metadata": {},
         }
 
         # Extract custom metadata if present
-        if hasattr(asset, "custom_metadata_sets") and asset.custom_metadata_sets:
-            for cmd_name, cmd_attrs in asset.custom_metadata_sets.items():
-                details["custom_metadata"][cmd_name] = cmd_attrs
+        custom_metadata_sets = getattr(asset, "custom_metadata_sets", None)
+        if custom_metadata_sets:
+            details["custom_metadata"].update(custom_metadata_sets)
 
         return details
 
@@ -249,23 +290,27 @@ class AtlanExplorer:
 
         results["connection_successful"] = True
 
-        # List Salesforce organizations
-        orgs = self.list_salesforce_organizations()
+        # The three list calls hit independent endpoints; run them
+        # concurrently instead of paying three sequential round-trips.
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            orgs_future = executor.submit(self.list_salesforce_organizations)
+            assets_future = executor.submit(self.list_salesforce_assets)
+            cmd_future = executor.submit(self.list_custom_metadata_defs)
+            orgs = orgs_future.result()
+            assets = assets_future.result()
+            cmd_list = cmd_future.result()
+
         results["salesforce_orgs"] = [
             {"name": org.name, "qualified_name": org.qualified_name}
             for org in orgs
         ]
 
-        # List Salesforce assets
-        assets = self.list_salesforce_assets()
         if assets:
             # Inspect a few sample assets
             for asset in assets[:3]:
                 details = self.inspect_salesforce_object_structure(asset)
                 results["salesforce_assets"].append(details)
 
-        # List custom metadata definitions
-        cmd_list = self.list_custom_metadata_defs()
         results["custom_metadata_defs"] = [
             {
                 "name": cmd.name,
@@ -287,18 +332,18 @@ class AtlanExplorer:
         Args:
             results: Dictionary of exploration results
         """
-        print(f"\n{'='*60}")
+        print(f"\n{_SEP}")
         print("SUMMARY")
-        print(f"{'='*60}\n")
+        print(f"{_SEP}\n")
 
         print(f"Connection Status: {'✓ Success' if results['connection_successful'] else '✗ Failed'}")
         print(f"Salesforce Organizations: {len(results['salesforce_orgs'])}")
         print(f"Salesforce Assets Found: {len(results['salesforce_assets'])}")
         print(f"Custom Metadata Defs: {len(results['custom_metadata_defs'])}")
 
-        print("\n" + "=" * 60)
+        print("\n" + _SEP)
         print("Exploration complete!")
-        print("=" * 60)
+        print(_SEP)
 
 
 def main():
@@ -319,8 +364,12 @@ def main():
 
     # Save results to file
     output_file = "atlan_exploration_results.json"
-    with open(output_file, "w") as f:
-        json.dump(results, f, indent=2, default=str)
+    if orjson is not None:
+        with open(output_file, "wb") as f:
+            f.write(orjson.dumps(results, default=str, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_file, "w") as f:
+            json.dump(results, f, indent=2, default=str)
 
     print(f"\nDetailed results saved to: {output_file}")
 
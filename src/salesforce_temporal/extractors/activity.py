@@ -19,7 +19,7 @@ import logging
 from datetime import datetime
 from typing import Dict, Generator, Optional
 
-from salesforce_temporal.extractors.base import BaseExtractor
+from salesforce_temporal.extractors.base import BaseExtractor, format_sf_timestamp, parse_sf_timestamp
 from salesforce_temporal.models.events import (
     ActorType,
     EventContext,
@@ -29,6 +29,43 @@ from salesforce_temporal.models.events import (
 
 logger = logging.getLogger(__name__)
 
+# Base SELECTs built once at import; the field lists never change per
+# extraction, so there is no reason to re-join them on every call.
+_TASK_FIELDS = (
+    "Id",
+    "Subject",
+    "Status",
+    "Priority",
+    "ActivityDate",
+    "CreatedDate",
+    "CompletedDateTime",
+    "WhoId",
+    "WhatId",
+    "OwnerId",
+    "IsClosed",
+    "TaskSubtype",
+    "CallType",
+    "CallDisposition",
+    "Description",
+)
+_TASK_SELECT = f"SELECT {', '.join(_TASK_FIELDS)} FROM Task"
+
+_EVENT_FIELDS = (
+    "Id",
+    "Subject",
+    "StartDateTime",
+    "EndDateTime",
+    "CreatedDate",
+    "WhoId",
+    "WhatId",
+    "OwnerId",
+    "EventSubtype",
+    "IsAllDayEvent",
+    "Description",
+    "Location",
+)
+_EVENT_SELECT = f"SELECT {', '.join(_EVENT_FIELDS)} FROM Event"
+
 
 class ActivityExtractor(BaseExtractor):
     """
@@ -109,51 +146,71 @@ class ActivityExtractor(BaseExtractor):
         Yields:
             MicroDecisionEvent instances
         """
-        fields = [
-            "Id",
-            "Subject",
-            "Status",
-            "Priority",
-            "ActivityDate",
-            "CreatedDate",
-            "CompletedDateTime",
-            "WhoId",
-            "WhatId",
-            "OwnerId",
-            "IsClosed",
-            "TaskSubtype",
-            "CallType",
-            "CallDisposition",
-            "Description",
-        ]
-
-        query = f"SELECT {', '.join(fields)} FROM Task"
+        query = _TASK_SELECT
 
         # Add date filters
         if start_date and end_date:
-            start_str = start_date.strftime("%Y-%m-%dT%H:%M:%SZ")
-            end_str = end_date.strftime("%Y-%m-%dT%H:%M:%SZ")
+            start_str = format_sf_timestamp(start_date)
+            end_str = format_sf_timestamp(end_date)
             query += f" WHERE CreatedDate >= {start_str} AND CreatedDate <= {end_str}"
         elif incremental:
-            query = self.build_incremental_query(query, "CreatedDate")
+            # Prefer the watermark persisted by the last successful run;
+            # it resumes exactly where that run left off instead of
+            # re-scanning the default lookback window.
+            watermark = self.load_watermark("Task")
+            if watermark is not None:
+                query += f" WHERE CreatedDate > {format_sf_timestamp(watermark)}"
+            else:
+                query = self.build_incremental_query(query, "CreatedDate")
 
-        query += " ORDER BY CreatedDate ASC"
+        # No ORDER BY: a global sort forces the server to buffer the full
+        # result set, and the incremental checkpoint only needs the max
+        # timestamp, tracked client side below.
 
         try:
-            for record in self.execute_query(query):
+            task_max: Optional[datetime] = None
+            for record in self._prefetch_iter(self.execute_query(query)):
                 event = self._convert_task_to_event(record)
                 if event:
                     yield event
                     self.extracted_count += 1
+                    if task_max is None or event.timestamp_recorded > task_max:
+                        task_max = event.timestamp_recorded
+                    if self._max_created is None or event.timestamp_recorded > self._max_created:
+                        self._max_created = event.timestamp_recorded
 
                     if self.extracted_count % 1000 == 0:
-                        logger.info(f"Processed {self.extracted_count} Task records")
+                        logger.info("Processed %d Task records", self.extracted_count)
+
+            # Checkpoint only after the full pass succeeds, so a failed
+            # run never advances the watermark past unprocessed records.
+            if task_max is not None:
+                self.save_watermark("Task", task_max)
 
         except Exception as e:
             logger.error(f"Error extracting Tasks: {e}")
             self.error_count += 1
             raise
 
+    @staticmethod
+    def _related_records_for(who_id: Optional[str], what_id: Optional[str]) -> Dict[str, str]:
+        """
+        Build the related_records dict shared by both converters.
+
+        Args:
+            who_id: WhoId value, if any
+            what_id: WhatId value, if any
+
+        Returns:
+            Dict with the non-empty IDs
+        """
+        related_records = {}
+        if who_id:
+            related_records["WhoId"] = who_id
+        if what_id:
+            related_records["WhatId"] = what_id
+        return related_records
+
     def _convert_task_to_event(self, record: Dict) -> Optional[MicroDecisionEvent]:
         """
         Convert a Task record to a MicroDecisionEvent.
@@ -166,29 +223,32 @@ class ActivityExtractor(BaseExtractor):
         """
         try:
             # Determine the primary related record (prefer WhatId over WhoId)
-            related_record_id = record.get("WhatId") or record.get("WhoId")
+            # Bind the lookup once; this converter runs per record, so the
+            # repeated LOAD_ATTR on record.get adds up.
+            get = record.get
+
+            who_id = get("WhoId")
+            what_id = get("WhatId")
+            related_record_id = what_id or who_id
             if not related_record_id:
                 # Task not related to any record, skip
                 return None
 
-            record_type = self._get_record_type_from_id(related_record_id)
+            record_type = self.record_type_from_id(related_record_id)
 
             # Parse timestamps
-            created_date = datetime.fromisoformat(record["CreatedDate"].replace("Z", "+00:00"))
+            created_date = parse_sf_timestamp(record["CreatedDate"])
 
             # Use CompletedDateTime if available, otherwise CreatedDate
-            completed_str = record.get("CompletedDateTime")
+            completed_str = get("CompletedDateTime")
             if completed_str:
-                timestamp_occurred = datetime.fromisoformat(completed_str.replace("Z", "+00:00"))
+                timestamp_occurred = parse_sf_timestamp(completed_str)
             else:
                 timestamp_occurred = created_date
 
-            # Build related records dict
-            related_records = {}
-            if record.get("WhoId"):
-                related_records["WhoId"] = record["WhoId"]
-            if record.get("WhatId"):
-                related_records["WhatId"] = record["WhatId"]
+            related_records = self._related_records_for(who_id, what_id)
+
+            status = get("Status")
 
             # Create context
             context = EventContext(
@@ -196,15 +256,15 @@ class ActivityExtractor(BaseExtractor):
                 source_record_id=record["Id"],
                 related_records=related_records,
                 activity_type="Task",
-                activity_subject=record.get("Subject"),
+                activity_subject=get("Subject"),
                 metadata={
-                    "status": record.get("Status"),
-                    "priority": record.get("Priority"),
-                    "task_subtype": record.get("TaskSubtype"),
-                    "call_type": record.get("CallType"),
-                    "call_disposition": record.get("CallDisposition"),
-                    "is_closed": record.get("IsClosed"),
-                    "activity_date": record.get("ActivityDate"),
+                    "status": status,
+                    "priority": get("Priority"),
+                    "task_subtype": get("TaskSubtype"),
+                    "call_type": get("CallType"),
+                    "call_disposition": get("CallDisposition"),
+                    "is_closed": get("IsClosed"),
+                    "activity_date": get("ActivityDate"),
                 },
             )
 
@@ -213,13 +273,13 @@ class ActivityExtractor(BaseExtractor):
                 event_type=EventType.ACTIVITY,
                 timestamp_occurred=timestamp_occurred,
                 timestamp_recorded=created_date,
-                actor_id=record.get("OwnerId"),
+                actor_id=get("OwnerId"),
                 actor_type=ActorType.USER,
                 record_type=record_type,
                 record_id=related_record_id,
                 field_name="TaskStatus",
                 old_value=None,
-                new_value=record.get("Status"),
+                new_value=status,
                 context=context,
                 extractor_version=self.version,
             )
@@ -248,42 +308,42 @@ class ActivityExtractor(BaseExtractor):
         Yields:
             MicroDecisionEvent instances
         """
-        fields = [
-            "Id",
-            "Subject",
-            "StartDateTime",
-            "EndDateTime",
-            "CreatedDate",
-            "WhoId",
-            "WhatId",
-            "OwnerId",
-            "EventSubtype",
-            "IsAllDayEvent",
-            "Description",
-            "Location",
-        ]
-
-        query = f"SELECT {', '.join(fields)} FROM Event"
+        query = _EVENT_SELECT
 
         # Add date filters
         if start_date and end_date:
-            start_str = start_date.strftime("%Y-%m-%dT%H:%M:%SZ")
-            end_str = end_date.strftime("%Y-%m-%dT%H:%M:%SZ")
+            start_str = format_sf_timestamp(start_date)
+            end_str = format_sf_timestamp(end_date)
             query += f" WHERE CreatedDate >= {start_str} AND CreatedDate <= {end_str}"
         elif incremental:
-            query = self.build_incremental_query(query, "CreatedDate")
+            # See _extract_tasks: resume from the persisted watermark
+            # when one exists.
+            watermark = self.load_watermark("Event")
+            if watermark is not None:
+                query += f" WHERE CreatedDate > {format_sf_timestamp(watermark)}"
+            else:
+                query = self.build_incremental_query(query, "CreatedDate")
 
-        query += " ORDER BY StartDateTime ASC"
+        # No ORDER BY: see _extract_tasks; the max timestamp is tracked
+        # client side instead of sorting server side.
 
         try:
-            for record in self.execute_query(query):
+            event_max: Optional[datetime] = None
+            for record in self._prefetch_iter(self.execute_query(query)):
                 event = self._convert_event_to_event(record)
                 if event:
                     yield event
                     self.extracted_count += 1
+                    if event_max is None or event.timestamp_recorded > event_max:
+                        event_max = event.timestamp_recorded
+                    if self._max_created is None or event.timestamp_recorded > self._max_created:
+                        self._max_created = event.timestamp_recorded
 
                     if self.extracted_count % 1000 == 0:
-                        logger.info(f"Processed {self.extracted_count} Event records")
+                        logger.info("Processed %d Event records", self.extracted_count)
+
+            if event_max is not None:
+                self.save_watermark("Event", event_max)
 
         except Exception as e:
             logger.error(f"Error extracting Events: {e}")
@@ -301,48 +361,49 @@ class ActivityExtractor(BaseExtractor):
             MicroDecisionEvent or None
         """
         try:
+            get = record.get
+
             # Determine the primary related record
-            related_record_id = record.get("WhatId") or record.get("WhoId")
+            who_id = get("WhoId")
+            what_id = get("WhatId")
+            related_record_id = what_id or who_id
             if not related_record_id:
                 return None
 
-            record_type = self._get_record_type_from_id(related_record_id)
+            record_type = self.record_type_from_id(related_record_id)
 
             # Parse timestamps
-            start_datetime = datetime.fromisoformat(record["StartDateTime"].replace("Z", "+00:00"))
-            end_datetime_str = record.get("EndDateTime")
+            start_datetime = parse_sf_timestamp(record["StartDateTime"])
+            end_datetime_str = get("EndDateTime")
             end_datetime = (
-                datetime.fromisoformat(end_datetime_str.replace("Z", "+00:00"))
+                parse_sf_timestamp(end_datetime_str)
                 if end_datetime_str
                 else None
             )
-            created_date = datetime.fromisoformat(record["CreatedDate"].replace("Z", "+00:00"))
+            created_date = parse_sf_timestamp(record["CreatedDate"])
 
-            # Build related records dict
-            related_records = {}
-            if record.get("WhoId"):
-                related_records["WhoId"] = record["WhoId"]
-            if record.get("WhatId"):
-                related_records["WhatId"] = record["WhatId"]
+            related_records = self._related_records_for(who_id, what_id)
 
             # Calculate duration if we have end time
             duration_hours = None
             if end_datetime:
                 duration_hours = (end_datetime - start_datetime).total_seconds() / 3600
 
+            subject = get("Subject")
+
             # Create context
             context = EventContext(
                 source_object="Event",
                 source_record_id=record["Id"],
                 related_records=related_records,
                 activity_type="Event",
-                activity_subject=record.get("Subject"),
+                activity_subject=subject,
                 metadata={
-                    "event_subtype": record.get("EventSubtype"),
-                    "is_all_day": record.get("IsAllDayEvent"),
-                    "location": record.get("Location"),
-                    "start_datetime": record.get("StartDateTime"),
-                    "end_datetime": record.get("EndDateTime"),
+                    "event_subtype": get("EventSubtype"),
+                    "is_all_day": get("IsAllDayEvent"),
+                    "location": get("Location"),
+                    "start_datetime": get("StartDateTime"),
+                    "end_datetime": end_datetime_str,
                     "duration_hours": duration_hours,
                 },
             )
@@ -352,13 +413,13 @@ class ActivityExtractor(BaseExtractor):
                 event_type=EventType.ACTIVITY,
                 timestamp_occurred=start_datetime,
                 timestamp_recorded=created_date,
-                actor_id=record.get("OwnerId"),
+                actor_id=get("OwnerId"),
                 actor_type=ActorType.USER,
                 record_type=record_type,
                 record_id=related_record_id,
                 field_name="EventOccurred",
                 old_value=None,
-                new_value=record.get("Subject"),
+                new_value=subject,
                 context=context,
                 extractor_version=self.version,
             )
@@ -370,33 +431,6 @@ class ActivityExtractor(BaseExtractor):
             self.error_count += 1
             return None
 
-    def _get_record_type_from_id(self, salesforce_id: str) -> str:
-        """
-        Determine record type from Salesforce ID prefix.
-
-        Args:
-            salesforce_id: Salesforce record ID
-
-        Returns:
-            Object type name
-        """
-        if not salesforce_id or len(salesforce_id) < 3:
-            return "Unknown"
-
-        prefix = salesforce_id[:3]
-
-        prefix_map = {
-            "006": "Opportunity",
-            "001": "Account",
-            "500": "Case",
-            "00Q": "Lead",
-            "003": "Contact",
-            "701": "Campaign",
-            "a00": "CustomObject",
-        }
-
-        return prefix_map.get(prefix, "Unknown")
-
     def get_activity_summary(self) -> Dict[str, any]:
         """
         Get summary statistics for activities.
@@ -11,10 +11,11 @@ approval from users, representing important governance and compliance micro-deci
 """
 
 import logging
+from collections import defaultdict
 from datetime import datetime
 from typing import Dict, Generator, Optional
 
-from salesforce_temporal.extractors.base import BaseExtractor
+from salesforce_temporal.extractors.base import BaseExtractor, format_sf_timestamp, parse_sf_timestamp
 from salesforce_temporal.models.events import (
     ActorType,
     EventContext,
@@ -24,6 +25,10 @@ from salesforce_temporal.models.events import (
 
 logger = logging.getLogger(__name__)
 
+# Shared fallback for records missing a subquery; read-only, so one
+# instance avoids allocating a fresh empty dict per converted record.
+_EMPTY: Dict = {}
+
 
 class ApprovalHistoryExtractor(BaseExtractor):
     """
@@ -115,8 +120,8 @@ class ApprovalHistoryExtractor(BaseExtractor):
 
         # Add date filters
         if start_date and end_date:
-            start_str = start_date.strftime("%Y-%m-%dT%H:%M:%SZ")
-            end_str = end_date.strftime("%Y-%m-%dT%H:%M:%SZ")
+            start_str = format_sf_timestamp(start_date)
+            end_str = format_sf_timestamp(end_date)
             query += f" WHERE CreatedDate >= {start_str} AND CreatedDate <= {end_str}"
         elif incremental:
             query = self.build_incremental_query(query, "CreatedDate")
@@ -124,14 +129,14 @@ class ApprovalHistoryExtractor(BaseExtractor):
         query += " ORDER BY ProcessInstanceId, CreatedDate ASC"
 
         try:
-            for record in self.execute_query(query):
+            for record in self._prefetch_iter(self.execute_query(query)):
                 event = self._convert_step_to_event(record)
                 if event:
                     yield event
                     self.extracted_count += 1
 
                     if self.extracted_count % 100 == 0:
-                        logger.info(f"Processed {self.extracted_count} approval steps")
+                        logger.info("Processed %d approval steps", self.extracted_count)
 
         except Exception as e:
             logger.error(f"Error extracting ProcessInstanceSteps: {e}")
@@ -149,32 +154,32 @@ class ApprovalHistoryExtractor(BaseExtractor):
             MicroDecisionEvent or None
         """
         try:
-            # Extract ProcessInstance data from subquery
-            process_instance = record.get("ProcessInstance", {})
-            target_object_id = process_instance.get("TargetObjectId")
+            # Extract ProcessInstance data from subquery. Bind the two
+            # dict lookups once; everything below reads through them.
+            get = record.get
+            pi_get = (get("ProcessInstance") or _EMPTY).get
+            target_object_id = pi_get("TargetObjectId")
 
             if not target_object_id:
-                logger.warning(f"Missing TargetObjectId for step {record.get('Id')}")
+                logger.warning(f"Missing TargetObjectId for step {get('Id')}")
                 return None
 
             # Parse timestamps
-            created_date = datetime.fromisoformat(record["CreatedDate"].replace("Z", "+00:00"))
-            modified_date = datetime.fromisoformat(
-                record["SystemModstamp"].replace("Z", "+00:00")
-            )
+            created_date = parse_sf_timestamp(record["CreatedDate"])
+            modified_date = parse_sf_timestamp(record["SystemModstamp"])
 
             # Get actor information
-            actor_id = record.get("ActorId")
-            step_status = record.get("StepStatus", "Unknown")
-            comments = record.get("Comments")
+            actor_id = get("ActorId")
+            step_status = get("StepStatus", "Unknown")
+            comments = get("Comments")
 
             # Get process definition name
-            process_def = process_instance.get("ProcessDefinition", {})
+            process_def = pi_get("ProcessDefinition") or _EMPTY
             process_name = process_def.get("Name", "Unknown Process")
 
             # Determine record type from TargetObjectId (3-character prefix)
             # e.g., '006' = Opportunity, '001' = Account
-            record_type = self._get_record_type_from_id(target_object_id)
+            record_type = self.record_type_from_id(target_object_id)
 
             # Create context with approval-specific information
             context = EventContext(
@@ -188,8 +193,8 @@ class ApprovalHistoryExtractor(BaseExtractor):
                 metadata={
                     "step_status": step_status,
                     "process_name": process_name,
-                    "process_status": process_instance.get("Status"),
-                    "submitted_by": process_instance.get("SubmittedById"),
+                    "process_status": pi_get("Status"),
+                    "submitted_by": pi_get("SubmittedById"),
                 },
             )
 
@@ -245,17 +250,17 @@ class ApprovalHistoryExtractor(BaseExtractor):
         try:
             for record in self.execute_query(query):
                 # Create events for pending approvals
-                process_instance = record.get("ProcessInstance", {})
-                target_object_id = process_instance.get("TargetObjectId")
+                pi_get = (record.get("ProcessInstance") or _EMPTY).get
+                target_object_id = pi_get("TargetObjectId")
 
                 if not target_object_id:
                     continue
 
-                created_date = datetime.fromisoformat(record["CreatedDate"].replace("Z", "+00:00"))
+                created_date = parse_sf_timestamp(record["CreatedDate"])
                 actor_id = record.get("ActorId")
-                record_type = self._get_record_type_from_id(target_object_id)
+                record_type = self.record_type_from_id(target_object_id)
 
-                process_def = process_instance.get("ProcessDefinition", {})
+                process_def = pi_get("ProcessDefinition") or _EMPTY
                 process_name = process_def.get("Name", "Unknown Process")
 
                 context = EventContext(
@@ -295,38 +300,6 @@ class ApprovalHistoryExtractor(BaseExtractor):
             logger.error(f"Error extracting ProcessInstanceWorkitems: {e}")
             self.error_count += 1
 
-    def _get_record_type_from_id(self, salesforce_id: str) -> str:
-        """
-        Determine record type from Salesforce ID prefix.
-
-        Salesforce IDs are 15 or 18 characters, with the first 3 characters
-        indicating the object type.
-
-        Args:
-            salesforce_id: Salesforce record ID
-
-        Returns:
-            Object type name (e.g., 'Opportunity', 'Account')
-        """
-        if not salesforce_id or len(salesforce_id) < 3:
-            return "Unknown"
-
-        prefix = salesforce_id[:3]
-
-        # Common object prefixes
-        prefix_map = {
-            "006": "Opportunity",
-            "001": "Account",
-            "500": "Case",
-            "00Q": "Lead",
-            "003": "Contact",
-            "00T": "Task",
-            "00U": "Event",
-            "a00": "CustomObject",  # Custom objects start with 'a'
-        }
-
-        return prefix_map.get(prefix, "Unknown")
-
     def get_approval_metrics(self) -> Dict[str, any]:
         """
         Calculate approval process metrics.
@@ -349,11 +322,12 @@ class ApprovalHistoryExtractor(BaseExtractor):
             GROUP BY StepStatus, ActorId
         """
 
-        metrics = {
-            "total_steps": 0,
-            "by_status": {},
-            "by_actor": {},
-        }
+        # SOQL already grouped the rows, so one streaming pass with
+        # defaultdicts is all the Python side needs — no membership
+        # checks in the inner loop.
+        total_steps = 0
+        by_status: Dict[str, int] = defaultdict(int)
+        by_actor: Dict[str, int] = defaultdict(int)
 
         try:
             for record in self.execute_query(query):
@@ -361,17 +335,15 @@ class ApprovalHistoryExtractor(BaseExtractor):
                 status = record.get("StepStatus", "Unknown")
                 actor_id = record.get("ActorId", "Unknown")
 
-                metrics["total_steps"] += count
-
-                if status not in metrics["by_status"]:
-                    metrics["by_status"][status] = 0
-                metrics["by_status"][status] += count
-
-                if actor_id not in metrics["by_actor"]:
-                    metrics["by_actor"][actor_id] = 0
-                metrics["by_actor"][actor_id] += count
+                total_steps += count
+                by_status[status] += count
+                by_actor[actor_id] += count
 
         except Exception as e:
             logger.error(f"Failed to calculate approval metrics: {e}")
 
-        return metrics
+        return {
+            "total_steps": total_steps,
+            "by_status": dict(by_status),
+            "by_actor": dict(by_actor),
+        }
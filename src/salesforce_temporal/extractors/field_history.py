@@ -16,7 +16,7 @@ import logging
 from datetime import datetime
 from typing import Dict, Generator, Optional
 
-from salesforce_temporal.extractors.base import BaseExtractor
+from salesforce_temporal.extractors.base import BaseExtractor, format_sf_timestamp, parse_sf_timestamp
 from salesforce_temporal.models.events import (
     ActorType,
     EventContext,
@@ -128,8 +128,8 @@ class FieldHistoryExtractor(BaseExtractor):
 
         # Add date filters
         if start_date and end_date:
-            start_str = start_date.strftime("%Y-%m-%dT%H:%M:%SZ")
-            end_str = end_date.strftime("%Y-%m-%dT%H:%M:%SZ")
+            start_str = format_sf_timestamp(start_date)
+            end_str = format_sf_timestamp(end_date)
             query = f"{base_query} WHERE CreatedDate >= {start_str} AND CreatedDate <= {end_str}"
         elif incremental:
             query = self.build_incremental_query(base_query, "CreatedDate")
@@ -141,7 +141,7 @@ class FieldHistoryExtractor(BaseExtractor):
 
         # Execute query and process records
         try:
-            for record in self.execute_query(query, use_bulk=use_bulk_api):
+            for record in self._prefetch_iter(self.execute_query(query, use_bulk=use_bulk_api)):
                 event = self._convert_to_event(record)
                 if event:
                     yield event
@@ -177,7 +177,7 @@ class FieldHistoryExtractor(BaseExtractor):
                 logger.warning(f"Missing parent ID in record: {record.get('Id')}")
                 return None
 
-            timestamp = datetime.fromisoformat(record["CreatedDate"].replace("Z", "+00:00"))
+            timestamp = parse_sf_timestamp(record["CreatedDate"])
             actor_id = record.get("CreatedById")
             field_name = record.get("Field")
             old_value = record.get("OldValue")
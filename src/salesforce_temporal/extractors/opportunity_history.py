@@ -10,7 +10,7 @@ import logging
 from datetime import datetime
 from typing import Dict, Generator, Optional
 
-from salesforce_temporal.extractors.base import BaseExtractor
+from salesforce_temporal.extractors.base import BaseExtractor, format_sf_timestamp, parse_sf_timestamp
 from salesforce_temporal.models.events import (
     ActorType,
     EventContext,
@@ -105,8 +105,8 @@ class OpportunityHistoryExtractor(BaseExtractor):
 
         # Add date filters
         if start_date and end_date:
-            start_str = start_date.strftime("%Y-%m-%dT%H:%M:%SZ")
-            end_str = end_date.strftime("%Y-%m-%dT%H:%M:%SZ")
+            start_str = format_sf_timestamp(start_date)
+            end_str = format_sf_timestamp(end_date)
             query = f"{base_query} WHERE CreatedDate >= {start_str} AND CreatedDate <= {end_str}"
         elif incremental:
             query = self.build_incremental_query(base_query, "CreatedDate")
@@ -121,7 +121,7 @@ class OpportunityHistoryExtractor(BaseExtractor):
             previous_record: Optional[Dict] = None
             current_opportunity_id: Optional[str] = None
 
-            for record in self.execute_query(query):
+            for record in self._prefetch_iter(self.execute_query(query)):
                 opportunity_id = record["OpportunityId"]
 
                 # Detect field changes by comparing with previous record
@@ -140,7 +140,7 @@ class OpportunityHistoryExtractor(BaseExtractor):
 
                 # Log progress
                 if self.extracted_count % 1000 == 0:
-                    logger.info(f"Processed {self.extracted_count} OpportunityHistory records")
+                    logger.info("Processed %d OpportunityHistory records", self.extracted_count)
 
         except Exception as e:
             logger.error(f"Error during OpportunityHistory extraction: {e}")
@@ -166,7 +166,7 @@ class OpportunityHistoryExtractor(BaseExtractor):
             MicroDecisionEvent instances
         """
         opportunity_id = record["OpportunityId"]
-        timestamp = datetime.fromisoformat(record["CreatedDate"].replace("Z", "+00:00"))
+        timestamp = parse_sf_timestamp(record["CreatedDate"])
         actor_id = record.get("CreatedById")
 
         # Base context for all events from this record
@@ -249,7 +249,7 @@ class OpportunityHistoryExtractor(BaseExtractor):
         for record in self.execute_query(query):
             opp_id = record["OpportunityId"]
             stage = record["StageName"]
-            timestamp = datetime.fromisoformat(record["CreatedDate"].replace("Z", "+00:00"))
+            timestamp = parse_sf_timestamp(record["CreatedDate"])
 
             if opp_id != current_opp_id:
                 # New opportunity
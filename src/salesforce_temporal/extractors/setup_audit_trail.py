@@ -16,7 +16,7 @@ import logging
 from datetime import datetime, timedelta
 from typing import Dict, Generator, Optional
 
-from salesforce_temporal.extractors.base import BaseExtractor
+from salesforce_temporal.extractors.base import BaseExtractor, format_sf_timestamp, parse_sf_timestamp
 from salesforce_temporal.models.events import (
     ActorType,
     EventContext,
@@ -106,18 +106,18 @@ class SetupAuditTrailExtractor(BaseExtractor):
 
         # Add date filters
         if start_date and end_date:
-            start_str = start_date.strftime("%Y-%m-%dT%H:%M:%SZ")
-            end_str = end_date.strftime("%Y-%m-%dT%H:%M:%SZ")
+            start_str = format_sf_timestamp(start_date)
+            end_str = format_sf_timestamp(end_date)
             query = f"{base_query} WHERE CreatedDate >= {start_str} AND CreatedDate <= {end_str}"
         elif incremental:
             # Use lookback days for incremental
             cutoff_date = datetime.utcnow() - timedelta(days=lookback_days)
-            cutoff_str = cutoff_date.strftime("%Y-%m-%dT%H:%M:%SZ")
+            cutoff_str = format_sf_timestamp(cutoff_date)
             query = f"{base_query} WHERE CreatedDate >= {cutoff_str}"
         else:
             # Full extraction - get all available records (up to 180 days)
             cutoff_date = datetime.utcnow() - timedelta(days=self.MAX_RETENTION_DAYS)
-            cutoff_str = cutoff_date.strftime("%Y-%m-%dT%H:%M:%SZ")
+            cutoff_str = format_sf_timestamp(cutoff_date)
             query = f"{base_query} WHERE CreatedDate >= {cutoff_str}"
 
         query += " ORDER BY CreatedDate ASC"
@@ -126,14 +126,14 @@ class SetupAuditTrailExtractor(BaseExtractor):
 
         # Execute query and process records
         try:
-            for record in self.execute_query(query):
+            for record in self._prefetch_iter(self.execute_query(query)):
                 event = self._convert_to_event(record)
                 if event:
                     yield event
                     self.extracted_count += 1
 
                     if self.extracted_count % 100 == 0:
-                        logger.info(f"Processed {self.extracted_count} SetupAuditTrail records")
+                        logger.info("Processed %d SetupAuditTrail records", self.extracted_count)
 
         except Exception as e:
             logger.error(f"Error during SetupAuditTrail extraction: {e}")
@@ -154,7 +154,7 @@ class SetupAuditTrailExtractor(BaseExtractor):
             MicroDecisionEvent or None
         """
         try:
-            timestamp = datetime.fromisoformat(record["CreatedDate"].replace("Z", "+00:00"))
+            timestamp = parse_sf_timestamp(record["CreatedDate"])
             actor_id = record.get("CreatedById")
             delegate_user = record.get("DelegateUser")
             action = record.get("Action", "Unknown")
@@ -277,7 +277,7 @@ class SetupAuditTrailExtractor(BaseExtractor):
         ]
 
         cutoff_date = datetime.utcnow() - timedelta(days=days)
-        cutoff_str = cutoff_date.strftime("%Y-%m-%dT%H:%M:%SZ")
+        cutoff_str = format_sf_timestamp(cutoff_date)
 
         actions_str = "', '".join(critical_actions)
         query = f"""
@@ -320,7 +320,7 @@ class SetupAuditTrailExtractor(BaseExtractor):
         logger.info(f"Calculating most active admins over {days} days...")
 
         cutoff_date = datetime.utcnow() - timedelta(days=days)
-        cutoff_str = cutoff_date.strftime("%Y-%m-%dT%H:%M:%SZ")
+        cutoff_str = format_sf_timestamp(cutoff_date)
 
         query = f"""
             SELECT COUNT(Id) total, CreatedById
@@ -190,4 +190,12 @@ class MicroDecisionEvent(BaseModel):
         """Convert event to JSON string."""
         return self.model_dump_json()
 
+    def to_json_bytes(self) -> bytes:
+        """Convert event to JSON bytes.
+
+        Serializes in pydantic-core without building an intermediate
+        Python dict, which is the cheapest path for per-event streaming.
+        """
+        return self.model_dump_json().encode()
+
     model_config = {"use_enum_values": True, "json_encoders": {datetime: lambda v: v.isoformat()}}
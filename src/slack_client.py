@@ -9,11 +9,23 @@ Requires a Slack Bot Token with the following scopes:
 - users:read
 """
 
+import asyncio
 import os
 import time
 from datetime import datetime, timedelta
 from typing import Optional
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# Concurrent conversations.replies requests; bounded to stay inside
+# Slack's tier-3 rate limits
+REPLY_CONCURRENCY = 10
 
 
 class SlackClientError(Exception):
@@ -45,10 +57,27 @@ class SlackClient:
         }
         self._user_cache = {}
 
+        # One pooled session for the whole run: paging
+        # conversations.history/replies makes dozens of requests, and
+        # keep-alive saves a TLS handshake (~100ms) on each after the
+        # first. Transient 5xx responses retry with backoff; 429 stays
+        # with the explicit Retry-After handling in _make_request.
+        self._session = requests.Session()
+        self._session.headers.update(self.headers)
+        self._session.mount("https://", HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=20,
+            max_retries=Retry(
+                total=5,
+                backoff_factor=0.5,
+                status_forcelist=[500, 502, 503, 504],
+            ),
+        ))
+
     def _make_request(self, endpoint: str, params: dict = None) -> dict:
         """Make a request to the Slack API with rate limiting."""
         url = f"{self.BASE_URL}/{endpoint}"
-        response = requests.get(url, headers=self.headers, params=params or {})
+        response = self._session.get(url, params=params or {})
 
         if response.status_code == 429:
             # Rate limited - wait and retry
@@ -190,11 +219,9 @@ class SlackClient:
         # Fetch thread replies for messages with replies
         print("Fetching thread replies...")
         formatted_messages = []
+        threads_needing_replies = []
 
-        for i, msg in enumerate(messages):
-            if i % 10 == 0:
-                print(f"  Processing message {i + 1}/{len(messages)}...")
-
+        for msg in messages:
             thread_ts = msg.get("thread_ts") or msg.get("ts")
             reply_count = msg.get("reply_count", 0)
 
@@ -210,14 +237,30 @@ class SlackClient:
                 "replies": []
             }
 
-            # Fetch replies if there are any
             if reply_count > 0:
-                formatted_msg["replies"] = self._get_thread_replies(
-                    channel_id, thread_ts, msg.get("ts")
+                threads_needing_replies.append(
+                    (formatted_msg, thread_ts, msg.get("ts"))
                 )
 
             formatted_messages.append(formatted_msg)
-            time.sleep(0.3)  # Rate limit protection
+
+        if threads_needing_replies:
+            if aiohttp is not None:
+                # Latency-bound stage: fetch replies for many threads
+                # concurrently instead of one round trip at a time
+                asyncio.run(self._fill_replies_async(
+                    channel_id, threads_needing_replies
+                ))
+            else:
+                for i, (formatted_msg, thread_ts, parent_ts) in enumerate(
+                        threads_needing_replies):
+                    if i % 10 == 0:
+                        print(f"  Processing thread {i + 1}/"
+                              f"{len(threads_needing_replies)}...")
+                    formatted_msg["replies"] = self._get_thread_replies(
+                        channel_id, thread_ts, parent_ts
+                    )
+                    time.sleep(0.3)  # Rate limit protection
 
         # Calculate date range
         if formatted_messages:
@@ -271,6 +314,99 @@ class SlackClient:
         except SlackClientError:
             return []
 
+    async def _fill_replies_async(self, channel_id: str, threads: list):
+        """Fetch replies for all threads concurrently and fill them in place.
+
+        Args:
+            threads: List of (formatted_msg, thread_ts, parent_ts) tuples;
+                each formatted_msg's "replies" list is populated.
+        """
+        semaphore = asyncio.Semaphore(REPLY_CONCURRENCY)
+
+        async with aiohttp.ClientSession(headers=self.headers) as session:
+            async def fetch(formatted_msg, thread_ts, parent_ts):
+                async with semaphore:
+                    formatted_msg["replies"] = await self._get_thread_replies_async(
+                        session, channel_id, thread_ts, parent_ts
+                    )
+
+            await asyncio.gather(*[
+                fetch(formatted_msg, thread_ts, parent_ts)
+                for formatted_msg, thread_ts, parent_ts in threads
+            ])
+
+    async def _make_request_async(self, session, endpoint: str,
+                                  params: dict = None) -> dict:
+        """Async twin of _make_request, with the same 429 handling."""
+        url = f"{self.BASE_URL}/{endpoint}"
+        async with session.get(url, params=params or {}) as response:
+            if response.status == 429:
+                retry_after = int(response.headers.get("Retry-After", 5))
+                print(f"Rate limited. Waiting {retry_after} seconds...")
+                await asyncio.sleep(retry_after)
+                return await self._make_request_async(session, endpoint, params)
+
+            data = await response.json()
+
+        if not data.get("ok"):
+            error = data.get("error", "Unknown error")
+            raise SlackClientError(f"Slack API error: {error}")
+
+        return data
+
+    async def _get_user_info_async(self, session, user_id: str) -> dict:
+        """Async twin of get_user_info (shares the same cache)."""
+        if user_id in self._user_cache:
+            return self._user_cache[user_id]
+
+        try:
+            data = await self._make_request_async(session, "users.info",
+                                                  {"user": user_id})
+            user = data.get("user", {})
+            user_info = {
+                "name": user.get("real_name") or user.get("name", "Unknown"),
+                "role": user.get("profile", {}).get("title", ""),
+                "username": user.get("name", "")
+            }
+            self._user_cache[user_id] = user_info
+            return user_info
+        except SlackClientError:
+            return {"name": "Unknown", "role": "", "username": user_id}
+
+    async def _get_thread_replies_async(self, session, channel_id: str,
+                                        thread_ts: str, parent_ts: str) -> list:
+        """Async twin of _get_thread_replies."""
+        try:
+            data = await self._make_request_async(session, "conversations.replies", {
+                "channel": channel_id,
+                "ts": thread_ts,
+                "limit": 100
+            })
+
+            replies = []
+            for msg in data.get("messages", []):
+                # Skip the parent message
+                if msg.get("ts") == parent_ts:
+                    continue
+
+                # Skip bot messages
+                if msg.get("subtype") or not msg.get("user"):
+                    continue
+
+                user_info = await self._get_user_info_async(session,
+                                                            msg.get("user", ""))
+                replies.append({
+                    "timestamp": self._ts_to_iso(msg.get("ts")),
+                    "user": user_info["username"],
+                    "user_role": user_info["role"],
+                    "message": msg.get("text", "")
+                })
+
+            return replies
+
+        except SlackClientError:
+            return []
+
     def _is_likely_question(self, text: str) -> bool:
         """Check if a message is likely a question about data."""
         text_lower = text.lower()
@@ -11,13 +11,19 @@ Usage:
 """
 
 import json
+import os
 import re
-from collections import defaultdict
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 from enum import Enum
 
+# Per-thread analysis only moves to worker processes above this message
+# count; below it the pool spawn cost outweighs the parallel speedup
+_PARALLEL_THRESHOLD = 200
+
 
 class QuestionType(Enum):
     DEFINITIONAL = "Definitional"
@@ -137,19 +143,52 @@ class SlackMetadataAnalyzer:
         r'(?P<person>\w+\.\w+)\s+is\s+(?:the\s+)?(?:primary\s+)?(?:contact|owner)',
     ]
 
+    # Compiled once at class-definition time; these run per message, so
+    # paying the re.compile cost up front keeps the hot loops cheap
+    BACKTICK_RE = re.compile(r'`([^`]+)`')
+    QUALIFIED_NAME_RE = re.compile(r'\b(\w+\.\w+(?:\.\w+)?)\b')
+    TABLE_PATTERN_RES = [
+        re.compile(r'\b((?:dim|fct|stg|raw)_\w+)\b', re.IGNORECASE),
+        re.compile(r'\b(\w+_(?:daily|weekly|monthly)(?:_v\d+)?)\b', re.IGNORECASE),
+        re.compile(r'\b(\w+_v\d+)\b', re.IGNORECASE),
+    ]
+    OWNERSHIP_RES = [re.compile(p, re.IGNORECASE) for p in OWNERSHIP_PATTERNS]
+    ENUM_RE = re.compile(r'(\d+)\s*[=:]\s*([^,\.\d][^,\.]*)')
+    FRESHNESS_RES = [
+        re.compile(r'(?:updates?|refreshes?|syncs?)\s+(?:every\s+)?(\d+\s*(?:minutes?|hours?|days?))', re.IGNORECASE),
+        re.compile(r'(\d+\s*(?:minutes?|hours?))\s+latency', re.IGNORECASE),
+        re.compile(r'refreshes?\s+at\s+(\d+\s*(?:am|pm)\s*\w*)', re.IGNORECASE),
+    ]
+    TERM_RES = [
+        re.compile(r'\b(ARR|MRR|DAU|MAU|LTV|CAC|NPS|CSAT|GMV|AOV|conversion|churn|retention)\b', re.IGNORECASE),
+        re.compile(r'\b(revenue|customer|user|subscription|order|product)\b', re.IGNORECASE),
+    ]
+
     def __init__(self, messages_data: dict):
         self.channel_name = messages_data.get('channel_name', 'Unknown')
         self.date_range = messages_data.get('date_range', 'Unknown')
         self.messages = messages_data.get('messages', [])
         self.assets: dict[str, AnalyzedAsset] = {}
 
-    def analyze(self) -> dict:
-        """Main analysis entry point."""
-        # Step 1: Extract and group by assets
-        self._identify_assets()
+    def analyze(self, workers: Optional[int] = None) -> dict:
+        """Main analysis entry point.
+
+        Args:
+            workers: Number of worker processes for the per-thread stage.
+                Defaults to os.cpu_count(); pass 1 to force sequential
+                analysis.
+        """
+        # Steps 1+2: per-thread asset identification, question
+        # classification and context extraction. Each thread is
+        # independent, so large inputs fan out to a process pool.
+        if workers != 1 and len(self.messages) >= _PARALLEL_THRESHOLD:
+            with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as ex:
+                partials = list(ex.map(self._analyze_thread, self.messages,
+                                       chunksize=32))
+        else:
+            partials = [self._analyze_thread(msg) for msg in self.messages]
 
-        # Step 2: Classify questions and extract context
-        self._analyze_threads()
+        self._merge(partials)
 
         # Step 3: Calculate priority scores
         self._calculate_priorities()
@@ -157,54 +196,76 @@ class SlackMetadataAnalyzer:
         # Step 4: Generate analysis report
         return self._generate_report()
 
-    def _identify_assets(self):
-        """Scan messages to identify mentioned data assets."""
-        for msg in self.messages:
-            assets_found = self._extract_assets_from_text(msg['message'])
-            for reply in msg.get('replies', []):
-                assets_found.extend(self._extract_assets_from_text(reply['message']))
-
-            # Dedupe and normalize
-            unique_assets = set()
-            for asset in assets_found:
-                normalized = self._normalize_asset_name(asset)
-                if normalized:
-                    unique_assets.add(normalized)
-
-            # Create or update asset records
-            for asset_name in unique_assets:
-                if asset_name not in self.assets:
-                    asset_type = self._infer_asset_type(asset_name)
-                    self.assets[asset_name] = AnalyzedAsset(
+    @classmethod
+    def _analyze_thread(cls, msg: dict) -> tuple:
+        """Analyze one thread: identify its assets, classify the question
+        and extract context.
+
+        Classmethod with picklable inputs and outputs so it can run in a
+        worker process.
+        """
+        question = msg['message']
+        question_type = cls._classify_question(question)
+
+        # Find which assets this thread is about
+        assets_found = cls._extract_assets_from_text(question)
+        for reply in msg.get('replies', []):
+            assets_found.extend(cls._extract_assets_from_text(reply['message']))
+
+        # Dedupe and normalize
+        unique_assets = set()
+        for asset in assets_found:
+            normalized = cls._normalize_asset_name(asset)
+            if normalized:
+                unique_assets.add(normalized)
+
+        # Extract context from answers
+        answers = [r['message'] for r in msg.get('replies', [])]
+        context = cls._extract_context(question, answers, question_type)
+
+        mention = AssetMention(
+            thread_id=msg['thread_id'],
+            timestamp=msg['timestamp'],
+            question=question,
+            question_type=question_type,
+            questioner=msg['user'],
+            questioner_role=msg.get('user_role', 'Unknown'),
+            answers=answers,
+            extracted_context=context
+        )
+        return mention, unique_assets
+
+    def _merge(self, partials: list):
+        """Reduce per-thread results into the asset map."""
+        for mention, asset_names in partials:
+            for asset_name in asset_names:
+                asset = self.assets.get(asset_name)
+                if asset is None:
+                    asset = self.assets[asset_name] = AnalyzedAsset(
                         name=asset_name,
-                        asset_type=asset_type
+                        asset_type=self._infer_asset_type(asset_name)
                     )
+                asset.mentions.append(mention)
 
-    def _extract_assets_from_text(self, text: str) -> list:
+    @classmethod
+    def _extract_assets_from_text(cls, text: str) -> list:
         """Extract potential asset names from text."""
         assets = []
 
         # Check for backtick-wrapped names
-        backtick_matches = re.findall(r'`([^`]+)`', text)
-        assets.extend(backtick_matches)
+        assets.extend(cls.BACKTICK_RE.findall(text))
 
         # Check for qualified names (schema.table or schema.table.column)
-        qualified_matches = re.findall(r'\b(\w+\.\w+(?:\.\w+)?)\b', text)
-        assets.extend(qualified_matches)
+        assets.extend(cls.QUALIFIED_NAME_RE.findall(text))
 
         # Check for known table patterns
-        table_patterns = [
-            r'\b((?:dim|fct|stg|raw)_\w+)\b',
-            r'\b(\w+_(?:daily|weekly|monthly)(?:_v\d+)?)\b',
-            r'\b(\w+_v\d+)\b',
-        ]
-        for pattern in table_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            assets.extend(matches)
+        for pattern in cls.TABLE_PATTERN_RES:
+            assets.extend(pattern.findall(text))
 
         return assets
 
-    def _normalize_asset_name(self, name: str) -> Optional[str]:
+    @staticmethod
+    def _normalize_asset_name(name: str) -> Optional[str]:
         """Normalize asset names to a standard format."""
         if not name or len(name) < 3:
             return None
@@ -216,7 +277,8 @@ class SlackMetadataAnalyzer:
 
         return name.lower().strip()
 
-    def _infer_asset_type(self, asset_name: str) -> AssetType:
+    @staticmethod
+    def _infer_asset_type(asset_name: str) -> AssetType:
         """Infer the type of asset from its name."""
         name_lower = asset_name.lower()
 
@@ -231,46 +293,13 @@ class SlackMetadataAnalyzer:
         else:
             return AssetType.TABLE  # Default assumption
 
-    def _analyze_threads(self):
-        """Analyze each thread to extract context and classify questions."""
-        for msg in self.messages:
-            question = msg['message']
-            question_type = self._classify_question(question)
-
-            # Find which assets this thread is about
-            assets_in_thread = set()
-            assets_in_thread.update(self._extract_assets_from_text(question))
-            for reply in msg.get('replies', []):
-                assets_in_thread.update(self._extract_assets_from_text(reply['message']))
-
-            # Extract context from answers
-            answers = [r['message'] for r in msg.get('replies', [])]
-            context = self._extract_context(question, answers, question_type)
-
-            # Create mention record
-            mention = AssetMention(
-                thread_id=msg['thread_id'],
-                timestamp=msg['timestamp'],
-                question=question,
-                question_type=question_type,
-                questioner=msg['user'],
-                questioner_role=msg.get('user_role', 'Unknown'),
-                answers=answers,
-                extracted_context=context
-            )
-
-            # Associate with assets
-            for asset in assets_in_thread:
-                normalized = self._normalize_asset_name(asset)
-                if normalized and normalized in self.assets:
-                    self.assets[normalized].mentions.append(mention)
-
-    def _classify_question(self, question: str) -> QuestionType:
+    @classmethod
+    def _classify_question(cls, question: str) -> QuestionType:
         """Classify the type of question being asked."""
         question_lower = question.lower()
 
         scores = {}
-        for q_type, keywords in self.QUESTION_KEYWORDS.items():
+        for q_type, keywords in cls.QUESTION_KEYWORDS.items():
             score = sum(1 for kw in keywords if kw in question_lower)
             scores[q_type] = score
 
@@ -279,24 +308,23 @@ class SlackMetadataAnalyzer:
             return best_match
         return QuestionType.UNKNOWN
 
-    def _extract_context(self, question: str, answers: list,
+    @classmethod
+    def _extract_context(cls, question: str, answers: list,
                          question_type: QuestionType) -> ExtractedContext:
         """Extract reusable context from thread answers."""
         context = ExtractedContext()
         full_text = ' '.join(answers)
 
         # Extract ownership information
-        for pattern in self.OWNERSHIP_PATTERNS:
-            matches = re.finditer(pattern, full_text, re.IGNORECASE)
-            for match in matches:
+        for pattern in cls.OWNERSHIP_RES:
+            for match in pattern.finditer(full_text):
                 if 'team' in match.groupdict() and match.group('team'):
                     context.ownership.append(f"{match.group('team')} Team")
                 elif 'person' in match.groupdict() and match.group('person'):
                     context.ownership.append(match.group('person'))
 
         # Extract enumeration values (common definitional pattern)
-        enum_pattern = r'(\d+)\s*[=:]\s*([^,\.\d][^,\.]*)'
-        enum_matches = re.findall(enum_pattern, full_text)
+        enum_matches = cls.ENUM_RE.findall(full_text)
         if enum_matches:
             enum_values = {int(k): v.strip() for k, v in enum_matches}
             if enum_values:
@@ -313,13 +341,8 @@ class SlackMetadataAnalyzer:
                     break
 
         # Extract freshness information
-        freshness_patterns = [
-            r'(?:updates?|refreshes?|syncs?)\s+(?:every\s+)?(\d+\s*(?:minutes?|hours?|days?))',
-            r'(\d+\s*(?:minutes?|hours?))\s+latency',
-            r'refreshes?\s+at\s+(\d+\s*(?:am|pm)\s*\w*)',
-        ]
-        for pattern in freshness_patterns:
-            match = re.search(pattern, full_text, re.IGNORECASE)
+        for pattern in cls.FRESHNESS_RES:
+            match = pattern.search(full_text)
             if match:
                 context.freshness_info = match.group(0)
                 break
@@ -335,12 +358,8 @@ class SlackMetadataAnalyzer:
                     break
 
         # Extract related business terms
-        term_patterns = [
-            r'\b(ARR|MRR|DAU|MAU|LTV|CAC|NPS|CSAT|GMV|AOV|conversion|churn|retention)\b',
-            r'\b(revenue|customer|user|subscription|order|product)\b'
-        ]
-        for pattern in term_patterns:
-            matches = re.findall(pattern, full_text, re.IGNORECASE)
+        for pattern in cls.TERM_RES:
+            matches = pattern.findall(full_text)
             context.related_terms.extend([m.upper() if len(m) <= 4 else m.title()
                                          for m in matches])
         context.related_terms = list(set(context.related_terms))
@@ -354,19 +373,28 @@ class SlackMetadataAnalyzer:
                 asset.priority_score = 0
                 continue
 
+            # Aggregate in a single pass over the mentions; the
+            # num_questions/unique_questioners/question_types properties
+            # each re-walk the list separately
+            questioners = set()
+            unique_types = set()
+            for mention in asset.mentions:
+                questioners.add(mention.questioner)
+                unique_types.add(mention.question_type)
+            num_questions = len(asset.mentions)
+
             # Base score from number of questions
-            question_score = min(asset.num_questions * 1.5, 5)
+            question_score = min(num_questions * 1.5, 5)
 
             # Diversity of questioners
-            diversity_score = min(asset.unique_questioners * 0.8, 2)
+            diversity_score = min(len(questioners) * 0.8, 2)
 
             # Question complexity (multiple question types = more complex)
-            unique_types = len(set(asset.question_types))
-            complexity_score = min(unique_types * 0.5, 2)
+            complexity_score = min(len(unique_types) * 0.5, 2)
 
             # Recurring questions bonus (same question asked multiple times)
             recurrence_bonus = 0
-            if asset.num_questions >= 3:
+            if num_questions >= 3:
                 recurrence_bonus = 1
 
             asset.priority_score = round(
@@ -383,16 +411,18 @@ class SlackMetadataAnalyzer:
             reverse=True
         )
 
-        # Calculate question type distribution
-        all_types = []
+        # Calculate question type distribution in one counting pass
+        # (list.count per type re-scanned the full list for every type)
+        type_counts = Counter()
         for asset in self.assets.values():
-            all_types.extend(asset.question_types)
+            type_counts.update(m.question_type.value for m in asset.mentions)
 
         type_distribution = {}
-        total = len(all_types) if all_types else 1
+        total = sum(type_counts.values()) or 1
         for q_type in QuestionType:
-            count = all_types.count(q_type.value)
-            type_distribution[q_type.value] = round(count / total * 100, 1)
+            type_distribution[q_type.value] = round(
+                type_counts[q_type.value] / total * 100, 1
+            )
 
         # Identify metadata gaps
         gaps = self._identify_metadata_gaps(sorted_assets)
@@ -18,6 +18,32 @@ import re
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 
+# Pattern to match: [HH:MM:SS] Speaker: Message or [HH:MM] Speaker: Message.
+# MULTILINE-anchored so one finditer pass scans the whole transcript in
+# the C regex engine instead of a per-line Python loop.
+_LINE_RE = re.compile(r'^\s*\[(\d{1,2}:\d{2}(?::\d{2})?)\]\s*([^:\n]+):[ \t]*(.+)',
+                      re.MULTILINE)
+
+# Words a question usually starts with
+_QUESTION_WORDS = frozenset([
+    'what', 'where', 'when', 'why', 'how', 'who', 'which',
+    'can', 'could', 'would', 'should', 'is', 'are', 'does',
+    'do', 'did', 'has', 'have', 'will'
+])
+
+# Data-related question phrasings
+_DATA_QUESTION_PATTERNS = (
+    'tell me about',
+    'explain',
+    'clarify',
+    'confused about',
+    'not sure',
+    'wondering',
+    'need to know',
+    'can someone',
+    'does anyone know'
+)
+
 
 def parse_transcript(transcript_text: str, title: str = "Call Transcript") -> dict:
     """
@@ -30,28 +56,19 @@ def parse_transcript(transcript_text: str, title: str = "Call Transcript") -> di
     Returns:
         Dictionary in Slack messages format with questions and replies
     """
-    lines = transcript_text.strip().split('\n')
-
-    # Pattern to match: [HH:MM:SS] Speaker: Message or [HH:MM] Speaker: Message
-    pattern = r'\[(\d{1,2}:\d{2}(?::\d{2})?)\]\s*([^:]+):\s*(.+)'
+    text = transcript_text.strip()
 
     messages = []
     current_thread = None
     base_time = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
 
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-
-        match = re.match(pattern, line)
-        if not match:
-            # If current thread exists, append as continuation
-            if current_thread and messages:
-                messages[-1]['message'] += ' ' + line
-            continue
+    # One linear scan over the contiguous text; non-matching lines between
+    # entries are folded in as continuations of the preceding message
+    matches = list(_LINE_RE.finditer(text))
 
+    for idx, match in enumerate(matches):
         timestamp_str, speaker, message = match.groups()
+        message = message.strip()
 
         # Parse timestamp
         time_parts = timestamp_str.split(':')
@@ -100,6 +117,14 @@ def parse_transcript(transcript_text: str, title: str = "Call Transcript") -> di
                 'replies': []
             })
 
+        # Fold any lines between this entry and the next timestamped one
+        # into the most recent top-level message as continuations
+        tail_end = matches[idx + 1].start() if idx + 1 < len(matches) else len(text)
+        for line in text[match.end():tail_end].splitlines():
+            line = line.strip()
+            if line:
+                messages[-1]['message'] += ' ' + line
+
     # Calculate date range
     if messages:
         first_time = datetime.fromisoformat(messages[0]['timestamp'])
@@ -131,32 +156,13 @@ def _is_question(text: str) -> bool:
     if '?' in text:
         return True
 
-    # Check for question words
-    question_words = [
-        'what', 'where', 'when', 'why', 'how', 'who', 'which',
-        'can', 'could', 'would', 'should', 'is', 'are', 'does',
-        'do', 'did', 'has', 'have', 'will'
-    ]
-
-    # Question usually starts with these words
-    first_word = text_lower.split()[0] if text_lower.split() else ''
-    if first_word in question_words:
+    # Question usually starts with a question word
+    first_word = text_lower.split(None, 1)[0] if text_lower else ''
+    if first_word in _QUESTION_WORDS:
         return True
 
     # Check for data-related question patterns
-    data_question_patterns = [
-        'tell me about',
-        'explain',
-        'clarify',
-        'confused about',
-        'not sure',
-        'wondering',
-        'need to know',
-        'can someone',
-        'does anyone know'
-    ]
-
-    for pattern in data_question_patterns:
+    for pattern in _DATA_QUESTION_PATTERNS:
         if pattern in text_lower:
             return True
 
@@ -1,10 +1,12 @@
 """Tests for base extractor."""
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from simple_salesforce.exceptions import SalesforceError
+
 from salesforce_temporal.extractors.base import BaseExtractor
 from salesforce_temporal.models.events import MicroDecisionEvent
 
@@ -17,6 +19,42 @@ class ConcreteExtractor(BaseExtractor):
         return iter([])
 
 
+def make_bulk_sf(states, pages=None):
+    """Build a mocked Salesforce client for the Bulk 2.0 endpoints.
+
+    Args:
+        states: Job states returned by successive status polls
+        pages: (csv_text, locator) tuples served as result pages
+
+    Returns:
+        MagicMock standing in for the connected client
+    """
+    sf = MagicMock()
+    sf.sf_instance = "test.my.salesforce.com"
+    sf.sf_version = "59.0"
+    sf.headers = {}
+
+    post_response = MagicMock()
+    post_response.json.return_value = {"id": "job1"}
+    sf.session.post.return_value = post_response
+
+    status_responses = []
+    for state in states:
+        response = MagicMock()
+        response.json.return_value = {"state": state, "errorMessage": "boom"}
+        status_responses.append(response)
+
+    page_responses = []
+    for text, locator in pages or []:
+        response = MagicMock()
+        response.text = text
+        response.headers = {"Sforce-Locator": locator} if locator else {}
+        page_responses.append(response)
+
+    sf.session.get.side_effect = status_responses + page_responses
+    return sf
+
+
 class TestBaseExtractor:
     """Tests for BaseExtractor class."""
 
@@ -95,6 +133,187 @@ class TestBaseExtractor:
         assert result == mock_sf_instance
         assert extractor.sf == mock_sf_instance
 
+    def test_watermark_round_trip(self, tmp_path, monkeypatch):
+        """Test that a saved watermark loads back."""
+        monkeypatch.setattr(BaseExtractor, "_STATE_DIR", tmp_path)
+        extractor = ConcreteExtractor()
+
+        saved = datetime(2024, 5, 1, 12, 30, 15, tzinfo=timezone.utc)
+        extractor.save_watermark("Task", saved)
+
+        assert extractor.load_watermark("Task") == saved
+
+    def test_watermark_truncates_to_seconds(self, tmp_path, monkeypatch):
+        """Test that sub-second precision truncates down, never up.
+
+        A truncated watermark re-fetches records from the same second on
+        the next run: duplicates are acceptable, lost records are not.
+        """
+        monkeypatch.setattr(BaseExtractor, "_STATE_DIR", tmp_path)
+        extractor = ConcreteExtractor()
+
+        saved = datetime(2024, 5, 1, 12, 30, 15, 999999, tzinfo=timezone.utc)
+        extractor.save_watermark("Task", saved)
+
+        loaded = extractor.load_watermark("Task")
+        assert loaded == saved.replace(microsecond=0)
+        assert loaded <= saved
+
+    def test_watermark_missing_returns_none(self, tmp_path, monkeypatch):
+        """Test that a missing state file yields no watermark."""
+        monkeypatch.setattr(BaseExtractor, "_STATE_DIR", tmp_path)
+        extractor = ConcreteExtractor()
+
+        assert extractor.load_watermark("Task") is None
+
+    def test_watermark_corrupt_returns_none(self, tmp_path, monkeypatch):
+        """Test that a corrupt state file yields no watermark."""
+        monkeypatch.setattr(BaseExtractor, "_STATE_DIR", tmp_path)
+        (tmp_path / "Task.json").write_text("{not json")
+        extractor = ConcreteExtractor()
+
+        assert extractor.load_watermark("Task") is None
+
+    def test_failed_run_does_not_advance_watermark(self, tmp_path, monkeypatch):
+        """Test that a pass that raises never saves a checkpoint."""
+        from salesforce_temporal.extractors.activity import ActivityExtractor
+
+        monkeypatch.setattr(BaseExtractor, "_STATE_DIR", tmp_path)
+        extractor = ActivityExtractor()
+
+        def failing_query(soql, use_bulk=False):
+            yield {
+                "Id": "00Txx000001",
+                "WhatId": "006xx000001X8Uz",
+                "CreatedDate": "2024-01-01T00:00:00.000Z",
+                "Subject": "Call",
+                "Status": "Open",
+                "OwnerId": "005xx000001",
+            }
+            raise ConnectionError("dropped mid-extraction")
+
+        with patch.object(extractor, "execute_query", failing_query):
+            with pytest.raises(ConnectionError):
+                list(extractor._extract_tasks(False, None, None))
+
+        assert extractor.load_watermark("Task") is None
+
+    def test_successful_run_saves_watermark(self, tmp_path, monkeypatch):
+        """Test that a completed pass checkpoints the max CreatedDate."""
+        from salesforce_temporal.extractors.activity import ActivityExtractor
+
+        monkeypatch.setattr(BaseExtractor, "_STATE_DIR", tmp_path)
+        extractor = ActivityExtractor()
+
+        def query(soql, use_bulk=False):
+            yield {
+                "Id": "00Txx000001",
+                "WhatId": "006xx000001X8Uz",
+                "CreatedDate": "2024-01-02T08:00:00.000Z",
+                "Subject": "Call",
+                "Status": "Open",
+                "OwnerId": "005xx000001",
+            }
+
+        with patch.object(extractor, "execute_query", query):
+            events = list(extractor._extract_tasks(False, None, None))
+
+        assert len(events) == 1
+        assert extractor.load_watermark("Task") == datetime(
+            2024, 1, 2, 8, 0, 0, tzinfo=timezone.utc
+        )
+
+    def test_prefetch_iter_releases_producer_on_early_exit(self):
+        """Test that abandoning the generator closes the source."""
+        import time
+
+        extractor = ConcreteExtractor()
+        closed = []
+
+        def source():
+            try:
+                for i in range(10000):
+                    yield {"Id": str(i)}
+            finally:
+                closed.append(True)
+
+        prefetched = extractor._prefetch_iter(source(), buffer_size=2)
+        assert next(prefetched)["Id"] == "0"
+        prefetched.close()
+
+        # The producer unblocks on the stop event and closes the source
+        for _ in range(50):
+            if closed:
+                break
+            time.sleep(0.02)
+        assert closed
+
+    def test_execute_bulk_query_paginates(self):
+        """Test that bulk results follow the locator chain in order."""
+        extractor = ConcreteExtractor()
+        sf = make_bulk_sf(
+            states=["JobComplete"],
+            pages=[
+                ("Id,Subject\n1,Call\n", "page2"),
+                ("Id,Subject\n2,Email\n", None),
+            ],
+        )
+
+        with patch.object(extractor, "connect", return_value=sf):
+            records = list(extractor.execute_bulk_query("SELECT Id FROM Task"))
+
+        assert [r["Id"] for r in records] == ["1", "2"]
+
+    def test_execute_bulk_query_normalizes_empty_to_none(self):
+        """Test that empty CSV cells yield None, matching the REST path."""
+        extractor = ConcreteExtractor()
+        sf = make_bulk_sf(
+            states=["JobComplete"],
+            pages=[("Id,WhoId,IsClosed\n1,,true\n", None)],
+        )
+
+        with patch.object(extractor, "connect", return_value=sf):
+            records = list(extractor.execute_bulk_query("SELECT Id FROM Task"))
+
+        assert records == [{"Id": "1", "WhoId": None, "IsClosed": "true"}]
+
+    def test_execute_bulk_query_polls_until_complete(self):
+        """Test that in-progress states are polled through."""
+        extractor = ConcreteExtractor()
+        sf = make_bulk_sf(
+            states=["UploadComplete", "InProgress", "JobComplete"],
+            pages=[("Id\n1\n", None)],
+        )
+
+        with patch.object(extractor, "connect", return_value=sf):
+            records = list(
+                extractor.execute_bulk_query("SELECT Id FROM Task", poll_interval=0)
+            )
+
+        assert len(records) == 1
+
+    def test_execute_bulk_query_failed_job(self):
+        """Test that a Failed job raises SalesforceError."""
+        extractor = ConcreteExtractor()
+        sf = make_bulk_sf(states=["Failed"])
+
+        with patch.object(extractor, "connect", return_value=sf):
+            with pytest.raises(SalesforceError):
+                list(extractor.execute_bulk_query("SELECT Id FROM Task"))
+
+    def test_execute_bulk_query_timeout(self):
+        """Test that a job stuck in progress times out."""
+        extractor = ConcreteExtractor()
+        sf = make_bulk_sf(states=["InProgress", "InProgress"])
+
+        with patch.object(extractor, "connect", return_value=sf):
+            with pytest.raises(TimeoutError):
+                list(
+                    extractor.execute_bulk_query(
+                        "SELECT Id FROM Task", poll_interval=0, timeout=-1
+                    )
+                )
+
     def test_execute_query_not_connected(self):
         """Test that execute_query connects if not already connected."""
         extractor = ConcreteExtractor()
@@ -0,0 +1,127 @@
+"""Tests for the CLI EventWriter."""
+
+import csv
+import gzip
+import json
+
+import pytest
+
+from salesforce_temporal.cli import EventWriter, save_events, zstandard
+
+EVENTS = [
+    {"id": "1", "value": "alpha"},
+    {"id": "2", "value": "beta"},
+]
+
+
+def read_back(path, compress):
+    """Read a written file back as text, decompressing if needed."""
+    if compress == "gzip":
+        with gzip.open(path, "rt") as f:
+            return f.read()
+    if compress == "zstd":
+        with open(path, "rb") as f:
+            return zstandard.ZstdDecompressor().stream_reader(f).read().decode()
+    with open(path) as f:
+        return f.read()
+
+
+class TestEventWriter:
+    """Tests for EventWriter round-trips across formats and compression."""
+
+    @pytest.mark.parametrize("compress", ["none", "gzip", "zstd"])
+    def test_jsonl_round_trip(self, tmp_path, compress):
+        """Test that jsonl output parses back to the written events."""
+        with EventWriter(str(tmp_path / "out.jsonl"), "jsonl", compress) as writer:
+            for event in EVENTS:
+                writer.write(event)
+
+        lines = read_back(writer.path, compress).splitlines()
+        assert [json.loads(line) for line in lines] == EVENTS
+        assert writer.count == len(EVENTS)
+
+    @pytest.mark.parametrize("compress", ["none", "gzip", "zstd"])
+    def test_json_round_trip(self, tmp_path, compress):
+        """Test that json output is one valid array of the written events."""
+        with EventWriter(str(tmp_path / "out.json"), "json", compress) as writer:
+            for event in EVENTS:
+                writer.write(event)
+
+        assert json.loads(read_back(writer.path, compress)) == EVENTS
+
+    @pytest.mark.parametrize("compress", ["none", "gzip", "zstd"])
+    def test_csv_round_trip(self, tmp_path, compress):
+        """Test that csv output keeps the header and all rows."""
+        with EventWriter(str(tmp_path / "out.csv"), "csv", compress) as writer:
+            for event in EVENTS:
+                writer.write(event)
+
+        rows = list(csv.DictReader(read_back(writer.path, compress).splitlines()))
+        assert rows == EVENTS
+
+    def test_compression_appends_suffix(self, tmp_path):
+        """Test that compressed output gets the matching file suffix."""
+        with EventWriter(str(tmp_path / "out.jsonl"), "jsonl", "gzip") as writer:
+            pass
+
+        assert writer.path.name == "out.jsonl.gz"
+
+    def test_empty_jsonl_file(self, tmp_path):
+        """Test that closing without writes leaves an empty jsonl file."""
+        with EventWriter(str(tmp_path / "out.jsonl"), "jsonl") as writer:
+            pass
+
+        assert writer.count == 0
+        assert read_back(writer.path, "none") == ""
+
+    def test_empty_json_file(self, tmp_path):
+        """Test that an empty json output is still a valid array."""
+        with EventWriter(str(tmp_path / "out.json"), "json") as writer:
+            pass
+
+        assert json.loads(read_back(writer.path, "none")) == []
+
+    def test_buffer_flushes_on_close(self, tmp_path):
+        """Test that buffered jsonl events below the limit land on close."""
+        writer = EventWriter(str(tmp_path / "out.jsonl"), "jsonl")
+        for event in EVENTS:
+            writer.write(event)
+
+        if writer._buffer is not None:
+            # Events are buffered (orjson path); nothing written yet
+            assert len(writer._buffer) < EventWriter.BUFFER_LIMIT
+        writer.close()
+
+        lines = read_back(writer.path, "none").splitlines()
+        assert [json.loads(line) for line in lines] == EVENTS
+
+    def test_rejects_unknown_format(self, tmp_path):
+        """Test that an unsupported format raises ValueError."""
+        with pytest.raises(ValueError):
+            EventWriter(str(tmp_path / "out.xml"), "xml")
+
+    def test_rejects_unknown_compression(self, tmp_path):
+        """Test that an unsupported compression raises ValueError."""
+        with pytest.raises(ValueError):
+            EventWriter(str(tmp_path / "out.jsonl"), "jsonl", "lz4")
+
+
+class TestSaveEvents:
+    """Tests for the save_events convenience wrapper."""
+
+    def test_save_events_jsonl(self, tmp_path):
+        """Test that save_events writes all events as jsonl."""
+        path = tmp_path / "events.jsonl"
+        save_events(EVENTS, str(path))
+
+        lines = path.read_text().splitlines()
+        assert [json.loads(line) for line in lines] == EVENTS
+
+    def test_save_events_stringifies_unknown_types(self, tmp_path):
+        """Test that non-native JSON types degrade to strings, not errors."""
+        from decimal import Decimal
+
+        path = tmp_path / "events.jsonl"
+        save_events([{"a": Decimal("1.5")}], str(path))
+
+        assert json.loads(path.read_text())["a"] == "1.5"